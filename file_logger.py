@@ -1,15 +1,283 @@
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import structlog
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    _dumps = partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+
+# Configuration key, structlog logger, and attached handler of the last configuration
+# applied per logger name
+_configured: dict[str, tuple[tuple, structlog.BoundLogger, logging.Handler]] = {}
+
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Size of the write buffer for log files; records are written in chunks of this size
+LOG_BUFFER_SIZE = 65536
+
+# Queue handler and background listener writing to the file, per logger name
+_listeners: dict[str, tuple[logging.handlers.QueueHandler, logging.handlers.QueueListener]] = {}
+
+
+def _cached_logger(
+    logger_name: str, key: tuple, log_level: int
+) -> Optional[structlog.BoundLogger]:
+    """
+    Return the logger from a previous identical configuration, if it is still in place.
+    
+    The configuration is only considered in place while the handler it attached is
+    still on the standard library logger and the logger level was not changed.
+    
+    Args:
+        logger_name: Name of the logger
+        key: Hashable description of the requested configuration
+        log_level: Requested logging level
+        
+    Returns:
+        structlog.BoundLogger or None: Cached logger, or None on a cache miss
+    """
+    cached = _configured.get(logger_name)
+    if cached is None or cached[0] != key:
+        return None
+    std_logger = logging.getLogger(logger_name)
+    if cached[2] not in std_logger.handlers or std_logger.level != log_level:
+        return None
+    return cached[1]
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler writing through a large stream buffer instead of flushing every record.
+    
+    The buffer is flushed when a record at or above `flush_level` is written, when
+    the background writer has no more queued records, and when the handler is closed.
+    """
+    
+    def __init__(
+        self,
+        filename: str | Path,
+        encoding: str = "utf-8",
+        buffer_size: int = LOG_BUFFER_SIZE,
+        flush_level: int = logging.WARNING,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename=filename, encoding=encoding)
+    
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener which flushes its handlers whenever it has caught up with the queue.
+    
+    Records arriving in bursts are still written in large chunks, but nothing waits in
+    the file buffer while the writer is idle.
+    """
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return super().dequeue(block)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format log records as single-line JSON objects.
+    
+    Args:
+        include_timestamp: Whether to include timestamp in logs
+        include_logger_name: Whether to include logger name in logs
+        include_level: Whether to include log level in logs
+    """
+    
+    def __init__(
+        self,
+        include_timestamp: bool = True,
+        include_logger_name: bool = True,
+        include_level: bool = True,
+    ):
+        super().__init__()
+        self.include_timestamp = include_timestamp
+        self.include_logger_name = include_logger_name
+        self.include_level = include_level
+    
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry = {
+            "message": record.getMessage(),
+        }
+        
+        if self.include_timestamp:
+            log_entry["timestamp"] = self.formatTime(record)
+        
+        if self.include_logger_name:
+            log_entry["logger"] = record.name
+        
+        if self.include_level:
+            log_entry["level"] = record.levelname
+        
+        # Add any extra fields from structlog
+        if hasattr(record, "structlog"):
+            log_entry.update(record.structlog)
+        
+        return _dumps(log_entry)
+
+
+@lru_cache(maxsize=None)
+def _text_formatter(log_format: str) -> logging.Formatter:
+    """Shared Formatter instance for each format string."""
+    return logging.Formatter(log_format)
+
+
+@lru_cache(maxsize=None)
+def _json_formatter(
+    include_timestamp: bool, include_logger_name: bool, include_level: bool
+) -> JSONFormatter:
+    """Shared JSONFormatter instance for each combination of options."""
+    return JSONFormatter(include_timestamp, include_logger_name, include_level)
+
+
+def _filtering_logger(logger_name: str, log_level: int) -> structlog.BoundLogger:
+    """
+    Get a structlog logger whose methods below `log_level` are no-ops.
+    
+    Args:
+        logger_name: Name of the logger
+        log_level: Minimum logging level
+        
+    Returns:
+        structlog.BoundLogger: Level-filtering structlog logger
+    """
+    return structlog.wrap_logger(
+        None,
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
+        logger_factory_args=(logger_name,),
+    )
+
+
+def _stop_listener(logger_name: str) -> Optional[logging.handlers.QueueHandler]:
+    """
+    Stop the background file writer of a logger, flushing all queued records.
+    
+    Args:
+        logger_name: Name of the logger
+        
+    Returns:
+        logging.handlers.QueueHandler or None: The queue handler which fed the listener
+    """
+    if logger_name not in _listeners:
+        return None
+    queue_handler, listener = _listeners.pop(logger_name)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    return queue_handler
+
+
+@atexit.register
+def _stop_all_listeners() -> None:
+    """Flush and close all background file writers."""
+    for logger_name in list(_listeners):
+        _stop_listener(logger_name)
+
+
+def _remove_file_handlers(std_logger: logging.Logger) -> None:
+    """
+    Close and detach all FileHandler handlers in a single pass over the handler list.
+    
+    This includes the queue or memory handler in front of a file handler.
+    
+    Args:
+        std_logger: Standard library logger to clean up
+    """
+    queue_handler = _stop_listener(std_logger.name)
+    kept = []
+    for handler in std_logger.handlers:
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+        elif isinstance(handler, logging.handlers.MemoryHandler) and isinstance(
+            handler.target, logging.FileHandler
+        ):
+            # Closing the memory handler flushes it, but leaves the target open
+            target = handler.target
+            handler.close()
+            target.close()
+        elif handler is not queue_handler:
+            kept.append(handler)
+    std_logger.handlers = kept
+
+
+def _attach_file_handler(
+    std_logger: logging.Logger, file_handler: logging.FileHandler, background: bool
+) -> logging.Handler:
+    """
+    Attach a file handler behind a queue, so callers never wait on file I/O.
+    
+    The background writer flushes the file whenever the queue is empty. Without a
+    background thread, records are instead batched in a MemoryHandler, which passes
+    them on after 512 records, at WARNING and above, and when the logger is reset.
+    
+    Args:
+        std_logger: Standard library logger to attach to
+        file_handler: Configured file handler
+        background: Write records from a background thread via QueueHandler/QueueListener
+        
+    Returns:
+        logging.Handler: The handler added to `std_logger`
+    """
+    if not background:
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=512, flushLevel=logging.WARNING, target=file_handler
+        )
+        std_logger.addHandler(memory_handler)
+        return memory_handler
+    
+    records = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(records)
+    listener = _FlushingQueueListener(
+        records, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    _listeners[std_logger.name] = (queue_handler, listener)
+    std_logger.addHandler(queue_handler)
+    return queue_handler
+
 
 def configure_file_logger(
     logger_name: str,
     log_file_path: str | Path,
     log_level: int = logging.INFO,
-    log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    log_format: str = DEFAULT_LOG_FORMAT,
     encoding: str = "utf-8",
+    background: bool = True,
 ) -> structlog.BoundLogger:
     """
     Configure a structlog logger to log messages only to a file.
@@ -20,6 +288,12 @@ def configure_file_logger(
         log_level: Logging level (default: INFO)
         log_format: Format string for log messages
         encoding: File encoding (default: utf-8)
+        background: Write to the file from a background thread (default: True)
+        
+    Records are written through a buffer. With `background`, the file is flushed as
+    soon as the writer thread has no more queued records. Without it, records are
+    held in memory until 512 have accumulated or one at WARNING or above is logged.
+    Both are flushed on `reset_logger_to_defaults` and at interpreter exit.
         
     Returns:
         structlog.BoundLogger: Configured structlog logger
@@ -32,6 +306,18 @@ def configure_file_logger(
     # Convert path to Path object if it's a string
     log_file_path = Path(log_file_path)
     
+    # Reuse the existing setup if this exact configuration was already applied
+    key = (
+        "text",
+        str(log_file_path.resolve()),
+        log_level,
+        log_format,
+        encoding,
+        background,
+    )
+    if (logger := _cached_logger(logger_name, key, log_level)) is not None:
+        return logger
+    
     # Create log directory if it doesn't exist
     log_file_path.parent.mkdir(parents=True, exist_ok=True)
     
@@ -40,28 +326,27 @@ def configure_file_logger(
     std_logger.setLevel(log_level)
     
     # Remove only FileHandler handlers to avoid duplicates while preserving other handlers
-    for handler in std_logger.handlers[:]:
-        if isinstance(handler, logging.FileHandler):
-            std_logger.removeHandler(handler)
+    _remove_file_handlers(std_logger)
     
-    # Create a simple file handler
-    file_handler = logging.FileHandler(
+    # Create a buffered file handler
+    file_handler = BufferedFileHandler(
         filename=log_file_path,
         encoding=encoding,
     )
     
     # Create formatter
-    formatter = logging.Formatter(log_format)
+    formatter = _text_formatter(log_format)
     file_handler.setFormatter(formatter)
     
     # Add handler to logger
-    std_logger.addHandler(file_handler)
+    handler = _attach_file_handler(std_logger, file_handler, background)
     
     # Prevent propagation to root logger to avoid console output
     std_logger.propagate = False
     
-    # Get the structlog logger
-    logger = structlog.get_logger(logger_name)
+    # Get a structlog logger which drops calls below `log_level` before any processing
+    logger = _filtering_logger(logger_name, log_level)
+    _configured[logger_name] = (key, logger, handler)
     
     return logger
 
@@ -74,6 +359,7 @@ def configure_structured_file_logger(
     include_timestamp: bool = True,
     include_logger_name: bool = True,
     include_level: bool = True,
+    background: bool = True,
 ) -> structlog.BoundLogger:
     """
     Configure a structlog logger with structured logging to a file.
@@ -86,6 +372,12 @@ def configure_structured_file_logger(
         include_timestamp: Whether to include timestamp in logs (default: True)
         include_logger_name: Whether to include logger name in logs (default: True)
         include_level: Whether to include log level in logs (default: True)
+        background: Write to the file from a background thread (default: True)
+        
+    Records are written through a buffer. With `background`, the file is flushed as
+    soon as the writer thread has no more queued records. Without it, records are
+    held in memory until 512 have accumulated or one at WARNING or above is logged.
+    Both are flushed on `reset_logger_to_defaults` and at interpreter exit.
         
     Returns:
         structlog.BoundLogger: Configured structlog logger with structured logging
@@ -94,11 +386,23 @@ def configure_structured_file_logger(
         >>> logger = configure_structured_file_logger("my_app", "logs/app.json")
         >>> logger.info("User logged in", user_id=123, ip="192.168.1.1")
     """
-    import json
-    
     # Convert path to Path object if it's a string
     log_file_path = Path(log_file_path)
     
+    # Reuse the existing setup if this exact configuration was already applied
+    key = (
+        "json",
+        str(log_file_path.resolve()),
+        log_level,
+        encoding,
+        include_timestamp,
+        include_logger_name,
+        include_level,
+        background,
+    )
+    if (logger := _cached_logger(logger_name, key, log_level)) is not None:
+        return logger
+    
     # Create log directory if it doesn't exist
     log_file_path.parent.mkdir(parents=True, exist_ok=True)
     
@@ -107,49 +411,27 @@ def configure_structured_file_logger(
     std_logger.setLevel(log_level)
     
     # Remove only FileHandler handlers to avoid duplicates while preserving other handlers
-    for handler in std_logger.handlers[:]:
-        if isinstance(handler, logging.FileHandler):
-            std_logger.removeHandler(handler)
+    _remove_file_handlers(std_logger)
     
-    # Create a simple file handler
-    file_handler = logging.FileHandler(
+    # Create a buffered file handler
+    file_handler = BufferedFileHandler(
         filename=log_file_path,
         encoding=encoding,
     )
     
     # Create JSON formatter for structured logging
-    class JSONFormatter(logging.Formatter):
-        def format(self, record):
-            log_entry = {
-                "message": record.getMessage(),
-            }
-            
-            if include_timestamp:
-                log_entry["timestamp"] = self.formatTime(record)
-            
-            if include_logger_name:
-                log_entry["logger"] = record.name
-            
-            if include_level:
-                log_entry["level"] = record.levelname
-            
-            # Add any extra fields from structlog
-            if hasattr(record, "structlog"):
-                log_entry.update(record.structlog)
-            
-            return json.dumps(log_entry)
-    
-    formatter = JSONFormatter()
+    formatter = _json_formatter(include_timestamp, include_logger_name, include_level)
     file_handler.setFormatter(formatter)
     
     # Add handler to logger
-    std_logger.addHandler(file_handler)
+    handler = _attach_file_handler(std_logger, file_handler, background)
     
     # Prevent propagation to root logger to avoid console output
     std_logger.propagate = False
     
-    # Get the structlog logger
-    logger = structlog.get_logger(logger_name)
+    # Get a structlog logger which drops calls below `log_level` before any processing
+    logger = _filtering_logger(logger_name, log_level)
+    _configured[logger_name] = (key, logger, handler)
     
     return logger
 
@@ -209,8 +491,10 @@ def reset_logger_to_defaults(logger_name: str) -> structlog.BoundLogger:
     """
     # Get the standard library logger
     std_logger = logging.getLogger(logger_name)
+    _configured.pop(logger_name, None)
     
-    # Remove all existing handlers
+    # Flush and close file handlers, then remove all existing handlers
+    _remove_file_handlers(std_logger)
     for handler in std_logger.handlers[:]:
         std_logger.removeHandler(handler)
     
@@ -245,22 +529,75 @@ def reset_all_loggers_to_defaults() -> None:
         >>> logger1.info("This goes to console")
         >>> logger2.info("This also goes to console")
     """
-    # Get all existing loggers
-    loggers = [logging.getLogger(name) for name in logging.root.manager.loggerDict]
+    _configured.clear()
+    _stop_all_listeners()
+    
+    # Snapshot all existing loggers in one pass instead of looking each up by name;
+    # placeholders are only nodes in the logger hierarchy and have no handlers
+    manager = logging.root.manager
+    with logging._lock:
+        loggers = [
+            logger
+            for logger in manager.loggerDict.values()
+            if isinstance(logger, logging.Logger)
+        ]
     
     # Also include the root logger
-    loggers.append(logging.getLogger())
+    loggers.append(logging.root)
     
     for logger in loggers:
-        # Remove all existing handlers
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
+        # Flush and close file handlers, then remove all existing handlers
+        _remove_file_handlers(logger)
+        logger.handlers = []
         
-        # Reset logger level to default
-        logger.setLevel(logging.NOTSET)
+        # Reset logger level to default; `setLevel` would clear the level cache of
+        # every logger each time, so it is cleared once below instead
+        logger.level = logging.NOTSET
         
         # Re-enable propagation
         logger.propagate = True
+    
+    manager._clear_cache()
+
+
+def debug_enabled(logger_name: str) -> bool:
+    """
+    Check if a logger would emit DEBUG records.
+    
+    Use this to guard debug calls whose arguments are expensive to compute,
+    as structured logging calls evaluate all their keyword arguments eagerly.
+    
+    Args:
+        logger_name: Name of the logger to check
+        
+    Returns:
+        bool: True if DEBUG records are enabled
+        
+    Example:
+        >>> if debug_enabled("flowmapper"):
+        ...     logger.debug("Match details", matches=summarize(matches))
+    """
+    return logging.getLogger(logger_name).isEnabledFor(logging.DEBUG)
+
+
+def disable_caller_lookup() -> None:
+    """
+    Stop the standard library from collecting caller, thread, and process details.
+    
+    By default every log record walks the call stack (`sys._getframe`) to fill
+    `%(filename)s`, `%(lineno)d`, and `%(funcName)s`, and looks up thread and process
+    information. The text and JSON formats used in this module don't use any of these
+    fields. This changes global `logging` settings, so it is not done on import; call
+    it once at application start-up when nothing else needs these fields.
+    
+    Example:
+        >>> disable_caller_lookup()
+        >>> logger = configure_structured_file_logger("my_app", "logs/app.json")
+    """
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
 
 def get_logger_info(logger_name: str) -> dict:
@@ -292,6 +629,9 @@ def get_logger_info(logger_name: str) -> dict:
 
 # Example usage and testing
 if __name__ == "__main__":
+    # None of the formats below use caller, thread, or process information
+    disable_caller_lookup()
+    
     # Example 1: Standard file logging
     logger1 = configure_file_logger("test_app", "logs/test.log")
     logger1.info("This is a test message")
@@ -13,11 +13,30 @@ __all__ = (
 
 __version__ = "0.4.2"
 
-from flowmapper.domain.flow import Flow
-from flowmapper.domain.match import Match
-from flowmapper.domain.match_condition import MatchCondition
-from flowmapper.domain.normalized_flow import NormalizedFlow
-from flowmapper.fields import CASField, ContextField
-from flowmapper.flowmap import Flowmap
-from flowmapper.main import flowmapper
-from flowmapper.unit import UnitField
+# Public names are imported on first access, so that `import flowmapper.cli`
+# (and with it `flowmapper --help`) doesn't load pandas, pint and randonneur.
+_lazy_imports = {
+    "Flow": "flowmapper.domain.flow",
+    "Match": "flowmapper.domain.match",
+    "MatchCondition": "flowmapper.domain.match_condition",
+    "NormalizedFlow": "flowmapper.domain.normalized_flow",
+    "CASField": "flowmapper.fields",
+    "ContextField": "flowmapper.fields",
+    "Flowmap": "flowmapper.flowmap",
+    "flowmapper": "flowmapper.main",
+    "UnitField": "flowmapper.unit",
+}
+
+
+def __getattr__(name: str):
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(_lazy_imports[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,18 +5,6 @@ from typing import Annotated
 import structlog
 import typer
 
-from flowmapper.extraction import (
-    ecospold2_biosphere_extractor,
-    simapro_csv_biosphere_extractor,
-)
-from flowmapper.main import flowmapper
-
-try:
-    from pyinstrument import Profiler
-except ImportError:
-    Profiler = None
-
-
 logger = structlog.get_logger("flowmapper")
 
 app = typer.Typer()
@@ -79,6 +67,8 @@ def map(
         typer.Option(help="Profile matching code with pyinstrument"),
     ] = False,
 ):
+    from flowmapper.main import flowmapper
+
     # Default generic mapping for JSON flow lists
     generic_mapping = {
         "expression language": "JSONPath",
@@ -93,9 +83,13 @@ def map(
     }
 
     if profile:
-        if Profiler is None:
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
             raise ImportError("`pyinstrument` not installed")
-        profiler = Profiler(interval=0.01)
+        # Sample every 10 ms; a separate timing thread avoids distorted
+        # profiles on systems where reading the clock is expensive
+        profiler = Profiler(interval=0.01, use_timing_thread=True)
         profiler.start()
 
     result = flowmapper(
@@ -123,8 +117,7 @@ def map(
 
     if profile:
         profiler.stop()
-        with open(f"{source.stem}-{target.stem}.html", "w") as f:
-            f.write(profiler.output_html())
+        profiler.write_html(Path(f"{source.stem}-{target.stem}.html"))
 
     return result
 
@@ -138,6 +131,8 @@ def extract_simapro_csv(
         Path, typer.Argument(help="File path for JSON results data")
     ],
 ) -> None:
+    from flowmapper.extraction import simapro_csv_biosphere_extractor
+
     simapro_csv_biosphere_extractor(simapro_csv_filepath, output_filepath)
 
 
@@ -150,4 +145,6 @@ def extract_ecospold2(
         Path, typer.Argument(help="File path for JSON results data")
     ],
 ) -> None:
+    from flowmapper.extraction import ecospold2_biosphere_extractor
+
     ecospold2_biosphere_extractor(elementary_exchanges_filepath, output_filepath)
@@ -1,7 +1,9 @@
 """Flow class representing an elementary flow with all its attributes."""
 
+import dataclasses
 import itertools
 import uuid
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, Self
 
@@ -20,7 +22,7 @@ from flowmapper.utils import remove_unit_slash
 global_counter = itertools.count(0)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Flow:
     """
     Represents an elementary flow with all its attributes.
@@ -72,7 +74,7 @@ class Flow:
     cas_number: CASField | None = None
     synonyms: list[str] = field(default_factory=lambda: [])
     conversion_factor: float | None = None
-    _id: int = field(default_factory=lambda: next(global_counter))
+    _id: int = field(default_factory=global_counter.__next__)
 
     @staticmethod
     def randonneur_mapping() -> dict:
@@ -124,21 +126,104 @@ class Flow:
         ...     "location": "NL"
         ... })
         """
-        return cls(
-            name=StringField(data["name"]),
-            unit=UnitField(data["unit"]),
-            context=ContextField(data["context"]),
-            identifier=data.get("identifier"),
-            location=data.get("location") or None,
-            oxidation_state=(
-                OxidationState(data["oxidation_state"])
-                if data.get("oxidation_state")
-                else None
-            ),
-            cas_number=CASField.from_string(data.get("cas_number") or None),
-            synonyms=data.get("synonyms") or [],
-            conversion_factor=data.get("conversion_factor"),
-        )
+        return cls(**_converted_fields(data, _field_converters))
+
+    @classmethod
+    def from_dicts(cls, data: Iterable[dict]) -> list[Self]:
+        """
+        Create Flow instances from many dictionaries at once.
+
+        Equivalent to ``[Flow.from_dict(obj) for obj in data]``, but unit and
+        context values are parsed once per distinct raw value and the
+        resulting field objects are shared between flows. Flow lists repeat a
+        small set of units and contexts across thousands of rows, so this
+        saves most of the per-row field construction. CAS numbers are
+        validated together with `CASField.from_strings`, once per distinct
+        value. Contexts given as lists are stored as tuples, so that list and
+        tuple inputs share one equal field.
+
+        Parameters
+        ----------
+        data : Iterable[dict]
+            Dictionaries in the format accepted by `from_dict`.
+
+        Returns
+        -------
+        list[Flow]
+            New Flow instances, in input order.
+
+        Examples
+        --------
+        >>> flows = Flow.from_dicts([
+        ...     {"name": "Carbon dioxide", "context": "air", "unit": "kg"},
+        ...     {"name": "Methane", "context": "air", "unit": "kg"},
+        ... ])
+        >>> flows[0].unit is flows[1].unit
+        True
+        """
+        units: dict[str, UnitField] = {}
+        contexts: dict[str | tuple, ContextField] = {}
+
+        def unit(value: str) -> UnitField:
+            try:
+                return units[value]
+            except KeyError:
+                units[value] = _field_converters["unit"](value)
+                return units[value]
+
+        def context(value: str | list | tuple) -> ContextField:
+            # Lists and tuples share one entry, so the field is built from the
+            # tuple key rather than whichever raw value came first
+            key = tuple(value) if isinstance(value, (list, tuple)) else value
+            try:
+                return contexts[key]
+            except KeyError:
+                contexts[key] = _field_converters["context"](key)
+                return contexts[key]
+
+        data = list(data)
+        cas_strings = list({obj["cas_number"] for obj in data if obj.get("cas_number")})
+        cas_numbers = dict(zip(cas_strings, CASField.from_strings(cas_strings)))
+
+        def cas_number(value: str | None) -> CASField | None:
+            return cas_numbers[value] if value else None
+
+        converters = _field_converters | {
+            "unit": unit,
+            "context": context,
+            "cas_number": cas_number,
+        }
+        return [cls(**_converted_fields(obj, converters)) for obj in data]
+
+    def replace(self, **kwargs: Any) -> Self:
+        """
+        Return a new Flow with some attributes replaced.
+
+        Values are converted as in `from_dict`, so raw strings can be given
+        for fields like ``name`` or ``unit``. Attributes which are not given
+        keep the existing field objects instead of being parsed again. The new
+        flow gets its own internal ``_id``.
+
+        Parameters
+        ----------
+        **kwargs
+            Flow attributes to replace (name, unit, context, location, etc.).
+
+        Returns
+        -------
+        Flow
+            A new Flow instance.
+
+        Examples
+        --------
+        >>> flow = Flow.from_dict({"name": "CO2", "context": "air", "unit": "kg"})
+        >>> flow.replace(unit="g").unit.data
+        'g'
+        """
+        for key, value in kwargs.items():
+            if key in _field_converters:
+                kwargs[key] = _field_converters[key](value)
+        return dataclasses.replace(self, _id=next(global_counter), **kwargs)
 
     def to_dict(self) -> dict:
         """
@@ -199,19 +284,63 @@ class Flow:
         >>> normalized.location
         'NL'
         """
-        location, oxidation_state = self.location, self.oxidation_state
-        name = remove_unit_slash(self)
-        name, other_location = split_location_suffix(name)
-        if other_location:
-            location = other_location
-        if OxidationState.has_oxidation_state(name):
-            oxidation_state, name = OxidationState.from_string(name)
+        return self._normalized_from_name_parts(
+            self._normalize_name_parts(remove_unit_slash(self))
+        )
+
+    @classmethod
+    def normalize_many(cls, flows: Iterable[Self]) -> list[Self]:
+        """
+        Normalize many flows, processing each distinct name only once.
+
+        Gives the same result as ``[flow.normalize() for flow in flows]``.
+        Unit slash removal runs for every flow, so its warning about
+        incompatible units is still logged per flow. The rest of the name
+        processing in `normalize` (location and oxidation state extraction)
+        depends only on the resulting name, so it is run once per distinct
+        name and reused for every flow sharing it. Unit and context
+        normalization are already cached per value.
+
+        Parameters
+        ----------
+        flows : Iterable[Flow]
+            Flows to normalize.
+
+        Returns
+        -------
+        list[Flow]
+            Normalized flows, in input order.
+        """
+        parts: dict[str, tuple] = {}
+        normalized = []
+        for flow in flows:
+            name = remove_unit_slash(flow)
+            if name not in parts:
+                parts[name] = cls._normalize_name_parts(name)
+            normalized.append(flow._normalized_from_name_parts(parts[name]))
+        return normalized
 
+    @staticmethod
+    def _normalize_name_parts(
+        name: str,
+    ) -> tuple[StringField, str | None, OxidationState | None]:
+        """Return the normalized name and any location and oxidation state it contains."""
+        oxidation_state = None
+        name, location = split_location_suffix(name)
+        if match := OxidationState.match(name):
+            oxidation_state, name = OxidationState.from_string(name, match=match)
+        return StringField(name).normalize(), location, oxidation_state
+
+    def _normalized_from_name_parts(
+        self, parts: tuple[StringField, str | None, OxidationState | None]
+    ) -> Self:
+        """Build the normalized flow from the output of `_normalize_name_parts`."""
+        name, location, oxidation_state = parts
         return type(self)(
             identifier=self.identifier,
-            name=StringField(name).normalize(),
-            location=location,
-            oxidation_state=oxidation_state,
+            name=name,
+            location=location or self.location,
+            oxidation_state=oxidation_state or self.oxidation_state,
             unit=self.unit.normalize(),
             context=self.context.normalize(),
             cas_number=self.cas_number,
@@ -311,10 +440,32 @@ class Flow:
 
     def __eq__(self, other: Any) -> bool:
         """Check equality based on internal _id."""
+        if self is other:
+            return True
         if not isinstance(other, Flow):
             return False
         return self._id == other._id
 
+    def __hash__(self) -> int:
+        """Hash on internal _id, consistent with `__eq__`."""
+        return self._id
+
+    @property
+    def sort_key(self) -> tuple:
+        """
+        Key for sorting flows by name, unit, context, and identifier.
+
+        Use ``sorted(flows, key=lambda flow: flow.sort_key)`` to build each key
+        once per flow instead of twice per comparison. A missing identifier
+        sorts as the empty string.
+        """
+        return (
+            self.name.data,
+            self.unit.data,
+            self.context.value,
+            self.identifier or "",
+        )
+
     def __lt__(self, other: Self) -> bool:
         """
         Compare flows for sorting.
@@ -323,15 +474,30 @@ class Flow:
         """
         if not isinstance(other, Flow):
             return False
-        else:
-            return (
-                self.name.data,
-                self.unit.data,
-                self.context.value,
-                self.identifier,
-            ) < (
-                other.name.data,
-                other.unit.data,
-                other.context.value,
-                other.identifier,
-            )
+        return self.sort_key < other.sort_key
+
+
+# Conversions from raw values to Flow attributes, used by `Flow.from_dict`,
+# `Flow.from_dicts`, and `Flow.replace`
+_field_converters = {
+    "name": StringField,
+    "unit": UnitField,
+    "context": ContextField,
+    "identifier": lambda value: value,
+    "location": lambda value: value or None,
+    "oxidation_state": lambda value: OxidationState(value) if value else None,
+    "cas_number": lambda value: CASField.from_string(value or None),
+    "synonyms": lambda value: value or [],
+    "conversion_factor": lambda value: value,
+}
+
+# Fields which must be present in the input of `Flow.from_dict`
+_required_fields = frozenset({"name", "unit", "context"})
+
+
+def _converted_fields(data: dict, converters: dict) -> dict:
+    """Convert the raw values in `data` to Flow attributes with `converters`."""
+    return {
+        key: convert(data[key] if key in _required_fields else data.get(key))
+        for key, convert in converters.items()
+    }
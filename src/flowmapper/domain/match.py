@@ -3,15 +3,38 @@
 from __future__ import annotations
 
 from collections import UserString
-from dataclasses import asdict, dataclass, field
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING
+
+from flowmapper.domain.flow import Flow
+from flowmapper.fields import ContextField
 
 if TYPE_CHECKING:
-    from flowmapper.domain.flow import Flow
     from flowmapper.domain.match_condition import MatchCondition
 
-
-@dataclass
+# Public Flow attributes included in `Match.export`, in dataclass field order
+FLOW_EXPORT_FIELDS = tuple(f.name for f in fields(Flow) if not f.name.startswith("_"))
+
+
+def _export_flow(flow: Flow) -> dict:
+    """Return the truthy public attributes of `flow` in serializable form."""
+    data = {}
+    for key in FLOW_EXPORT_FIELDS:
+        value = getattr(flow, key)
+        if not value:
+            continue
+        if isinstance(value, (str, UserString)):
+            # Also converts `str` subclasses such as `CASField` to plain strings
+            value = str(value)
+        elif isinstance(value, ContextField):
+            value = value.value
+        if isinstance(value, list):
+            value = list(value)
+        data[key] = value
+    return data
+
+
+@dataclass(slots=True)
 class Match:
     """
     Represents a match between a source flow and a target flow.
@@ -69,6 +92,8 @@ class Match:
     conversion_factor: float = 1.0
     comment: str = field(default_factory=lambda: "")
     new_target_flow: bool = False
+    # Filled in by `sort_key`; a slot rather than a cached_property
+    _sort_key: tuple | None = field(default=None, init=False, repr=False, compare=False)
 
     def export(self, flowmapper_metadata: bool = False) -> dict:
         """
@@ -98,37 +123,42 @@ class Match:
         {'source': {...}, 'target': {...}, 'condition': '...', 'flowmapper_metadata': {...}, ...}
         """
         from flowmapper import __version__
-        from flowmapper.fields import ContextField
-
-        def serializable(obj: Any) -> Any:
-            if isinstance(obj, UserString):
-                return str(obj)
-            elif isinstance(obj, ContextField):
-                return obj.value
-            return obj
-
-        data = asdict(self)
-        data["source"] = {
-            k: serializable(v)
-            for k, v in data["source"].items()
-            if v and not k.startswith("_")
-        }
-        data["target"] = {
-            k: serializable(v)
-            for k, v in data["target"].items()
-            if v and not k.startswith("_")
+
+        data = {
+            "source": _export_flow(self.source),
+            "target": _export_flow(self.target),
+            "condition": str(self.condition),
+            "conversion_factor": self.conversion_factor,
+            "comment": self.comment,
+            "new_target_flow": self.new_target_flow,
         }
-        data["condition"] = str(data["condition"])
 
-        function_name = data.pop("function_name")
         if flowmapper_metadata:
             data["flowmapper_metadata"] = {
                 "version": __version__,
-                "function_name": function_name,
+                "function_name": self.function_name,
             }
 
         return data
 
+    @property
+    def sort_key(self) -> tuple:
+        """
+        Key for sorting matches; see `__lt__`.
+
+        Computed once per match, so ``sorted(matches, key=...)`` and repeated
+        sorts don't rebuild it. Flows are frozen, and `source` and `target`
+        are not reassigned after a match is created.
+        """
+        if self._sort_key is None:
+            self._sort_key = (
+                self.source.name.data,
+                self.source.context.value,
+                self.target.name.data,
+                self.target.context.value,
+            )
+        return self._sort_key
+
     def __lt__(self, other: Match) -> bool:
         """
         Compare matches for sorting.
@@ -136,14 +166,4 @@ class Match:
         Matches are sorted by source name, source context, target name,
         and target context in that order.
         """
-        return (
-            self.source.name,
-            self.source.context,
-            self.target.name,
-            self.target.context,
-        ) < (
-            other.source.name,
-            other.source.context,
-            other.target.name,
-            other.target.context,
-        )
+        return self.sort_key < other.sort_key
@@ -70,14 +70,14 @@ class MatchCondition(StrEnum):
         >>> MatchCondition.related.as_glad()
         '~'
         """
-        if self.value == "http://www.w3.org/2004/02/skos/core#exactMatch":
-            return "="
-        elif self.value == "http://www.w3.org/2004/02/skos/core#closeMatch":
-            return "~"
-        elif self.value == "http://www.w3.org/2004/02/skos/core#relatedMatch":
-            return "~"
-        elif self.value == "http://www.w3.org/2004/02/skos/core#narrowMatch":
-            return ">"
-        elif self.value == "http://www.w3.org/2004/02/skos/core#broadMatch":
-            return "<"
-        raise ValueError  # Just for silly type checking
+        return GLAD_SYMBOLS[self]
+
+
+# Resolved once at import; `MatchCondition.as_glad` is a single lookup
+GLAD_SYMBOLS = {
+    MatchCondition.exact: "=",
+    MatchCondition.close: "~",
+    MatchCondition.related: "~",
+    MatchCondition.narrow: ">",
+    MatchCondition.broad: "<",
+}
@@ -2,15 +2,12 @@
 
 from __future__ import annotations
 
-from copy import copy
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Self
 
 if TYPE_CHECKING:
     from flowmapper.domain.flow import Flow
 
 
-@dataclass
 class NormalizedFlow:
     """
     Represents a flow with its original, normalized, and current states.
@@ -33,6 +30,10 @@ class NormalizedFlow:
         The current state of the flow (can be modified).
     matched : bool, default=False
         Whether this flow has been matched to a target flow.
+    name, unit, context, identifier, location, oxidation_state, cas_number, synonyms
+        Plain values taken from `current` (e.g. ``current.name.data``). They are
+        updated every time `current` is assigned; change `current` rather than
+        assigning them directly.
 
     Examples
     --------
@@ -47,58 +48,89 @@ class NormalizedFlow:
     >>> nf = NormalizedFlow(
     ...     original=flow,
     ...     normalized=normalized,
-    ...     current=copy(normalized)
+    ...     current=normalized
     ... )
     >>> nf.update_current(name="Modified")
     >>> nf.reset_current()  # Reset to normalized state
     """
 
+    # The derived slots hold plain values from `current`, refreshed whenever
+    # `current` is assigned so that matching code reads them as attributes
+    # instead of through properties and two or three attribute lookups each time
+    __slots__ = (
+        "original",
+        "normalized",
+        "_current",
+        "matched",
+        "name",
+        "unit",
+        "context",
+        "identifier",
+        "location",
+        "oxidation_state",
+        "cas_number",
+        "synonyms",
+    )
+
     original: Flow
     normalized: Flow
-    current: Flow
-    matched: bool = False
-
-    @property
-    def name(self) -> str:
-        """Return the current flow's name."""
-        return self.current.name.data
-
-    @property
-    def unit(self) -> str:
-        """Return the current flow's unit."""
-        return self.current.unit.data
-
-    @property
-    def context(self) -> str | list[str] | tuple[str]:
-        """Return the current flow's context."""
-        return self.current.context.value
-
-    @property
-    def identifier(self) -> str | None:
-        """Return the current flow's identifier."""
-        return self.current.identifier
-
-    @property
-    def location(self) -> str | None:
-        """Return the current flow's location."""
-        return self.current.location
-
-    @property
-    def oxidation_state(self) -> int | None:
-        """Return the current flow's oxidation state value."""
-        return (
-            self.current.oxidation_state.value if self.current.oxidation_state else None
+    matched: bool
+    name: str
+    unit: str
+    context: str | tuple[str, ...]
+    identifier: str | None
+    location: str | None
+    oxidation_state: int | None
+    cas_number: str | None
+    synonyms: list[str] | None
+
+    def __init__(
+        self, original: Flow, normalized: Flow, current: Flow, matched: bool = False
+    ) -> None:
+        self.original = original
+        self.normalized = normalized
+        self.current = current
+        self.matched = matched
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.original, self.normalized, self.current, self.matched) == (
+            other.original,
+            other.normalized,
+            other.current,
+            other.matched,
         )
 
-    @property
-    def cas_number(self) -> str | None:
-        """Return the current flow's CAS number."""
-        return self.current.cas_number.data if self.current.cas_number else None
+    __hash__ = None
 
     @property
-    def synonyms(self) -> list[str] | None:
-        """Return the current flow's synonyms."""
-        return self.current.synonyms
+    def current(self) -> Flow:
+        """Return the current state of the flow."""
+        return self._current
+
+    @current.setter
+    def current(self, value: Flow) -> None:
+        self._current = value
+        self._sync_current()
+
+    def _sync_current(self) -> None:
+        """Copy the plain attribute values of `current` onto this object."""
+        current = self._current
+        self.name = current.name.data
+        self.unit = current.unit.data
+        # Lists become tuples so that contexts can be used in grouping keys
+        context = current.context.value
+        self.context = tuple(context) if isinstance(context, list) else context
+        self.identifier = current.identifier
+        self.location = current.location
+        self.oxidation_state = (
+            current.oxidation_state.value if current.oxidation_state else None
+        )
+        self.cas_number = current.cas_number.data if current.cas_number else None
+        self.synonyms = current.synonyms
 
     @property
     def id(self) -> int:
@@ -109,18 +141,19 @@ class NormalizedFlow:
         """
         Reset the current flow to the normalized state.
 
-        This method creates a copy of the normalized flow and sets it as the
-        current flow. Useful after applying temporary transformations.
+        This method sets the normalized flow as the current flow. Flows are
+        frozen, so no copy is needed. Useful after applying temporary
+        transformations.
         """
-        self.current = copy(self.normalized)
+        self.current = self.normalized
 
     def update_current(self, **kwargs) -> None:
         """
         Update the current flow with new attribute values.
 
-        This method creates a new Flow based on the normalized flow's data,
-        updated with the provided keyword arguments. The normalized flow
-        remains unchanged.
+        This method creates a new Flow from the normalized flow with the
+        provided keyword arguments replaced (see `Flow.replace`). The
+        normalized flow remains unchanged.
 
         Parameters
         ----------
@@ -132,11 +165,7 @@ class NormalizedFlow:
         --------
         >>> nf.update_current(name="Modified name", unit="g")
         """
-        from flowmapper.domain.flow import Flow
-
-        data = self.normalized.to_dict()
-        data.update(kwargs)
-        self.current = Flow.from_dict(data)
+        self.current = self.normalized.replace(**kwargs)
 
     @staticmethod
     def from_dict(data: dict) -> NormalizedFlow:
@@ -162,7 +191,7 @@ class NormalizedFlow:
         # Do data preprocessing here
         normalized = original.normalize()
         return NormalizedFlow(
-            original=original, normalized=normalized, current=copy(normalized)
+            original=original, normalized=normalized, current=normalized
         )
 
     def unit_compatible(self, other: Self) -> bool:
@@ -213,22 +242,23 @@ class NormalizedFlow:
         dict
             Dictionary containing flow data with only non-None values.
         """
-        data = [
-            ("name", self.original.name.data),
-            ("unit", self.original.unit.data),
-            ("context", self.original.context.value),
-            ("identifier", self.original.identifier),
-            ("location", self.original.location),
-            (
-                "cas_number",
-                (
-                    self.normalized.cas_number.export()
-                    if self.normalized.cas_number
-                    else None
-                ),
-            ),
-        ]
-        return {k: v for k, v in data if v}
+        original = self.original
+        data = {}
+        if value := original.name.data:
+            data["name"] = value
+        if value := original.unit.data:
+            data["unit"] = value
+        if value := original.context.value:
+            data["context"] = value
+        if value := original.identifier:
+            data["identifier"] = value
+        if value := original.location:
+            data["location"] = value
+        if self.normalized.cas_number and (
+            value := self.normalized.cas_number.export()
+        ):
+            data["cas_number"] = value
+        return data
 
     def __repr__(self) -> str:
         """Return a string representation showing non-None attributes of original and current."""
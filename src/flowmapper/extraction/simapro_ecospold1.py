@@ -3,6 +3,11 @@ from pathlib import Path
 
 import pyecospold
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def simapro_ecospold1_biosphere_extractor(dirpath: Path, output_fp: Path) -> None:
     """Load all simapro files in directory `dirpath`, and extract all biosphere flows"""
@@ -14,10 +19,11 @@ def simapro_ecospold1_biosphere_extractor(dirpath: Path, output_fp: Path) -> Non
                 if exc.groupsStr[0] in ("ToNature", "FromNature"):
                     flows.add(((exc.category, exc.subCategory), exc.name, exc.unit))
 
-    with open(output_fp, "w") as f:
-        json.dump(
-            [{"context": c, "name": n, "unit": u} for c, n, u in sorted(flows)],
-            f,
-            indent=2,
-            ensure_ascii=False,
-        )
+    data = [{"context": c, "name": n, "unit": u} for c, n, u in sorted(flows)]
+
+    if orjson is not None:
+        # Same output as `json.dump(..., indent=2, ensure_ascii=False)`
+        Path(output_fp).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_fp, "w") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
@@ -1,69 +1,171 @@
-import re
 from collections import UserString
-from functools import cached_property
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
-valid_cas = re.compile(r"^\s*[0-9]{2,7}-[0-9]{2}-[0-9]{1}\s*$")
+import numpy as np
 
+# CAS numbers have at most ten digits; shorter numbers are left-padded with zeros
+# (which don't change the checksum) so a whole column fits in one digit matrix.
+MAX_CAS_DIGITS = 10
+CHECK_DIGIT_WEIGHTS = np.arange(MAX_CAS_DIGITS - 1, 0, -1)
 
-class CASField(UserString):
-    def __init__(self, string: str):
+
+def _fast_valid_cas(string: str) -> bool:
+    """Check CAS formatting, i.e. the regular expression `[0-9]{2,7}-[0-9]{2}-[0-9]`.
+
+    Expects `string` to already be stripped of surrounding whitespace."""
+    return (
+        7 <= len(string) <= 12
+        and string.isascii()
+        and string[-2] == "-"
+        and string[-5] == "-"
+        and string[:-5].isdigit()
+        and string[-4:-2].isdigit()
+        and string[-1].isdigit()
+    )
+
+
+def _normalize_cas_string(string: str) -> str:
+    """Equivalent to `string.strip().lstrip("0").strip()`, with a single slice."""
+    start, end = 0, len(string)
+    while start < end and string[start].isspace():
+        start += 1
+    while start < end and string[start] == "0":
+        start += 1
+    while start < end and string[start].isspace():
+        start += 1
+    while end > start and string[end - 1].isspace():
+        end -= 1
+    return string[start:end]
+
+
+class CASField(str):
+    """CAS registry number.
+
+    A `str` subclass, so comparisons against other `CASField` objects, hashing, and
+    container membership use the built-in string implementations. The original
+    input, including any surrounding whitespace, is the string value."""
+
+    __slots__ = ("_digits", "_check_digit", "_canonical")
+
+    def __new__(cls, string: str) -> "CASField":
         if not isinstance(string, (str, UserString)):
             raise TypeError(
                 f"CASField takes only `str`, but got {type(string)} for {string}"
             )
-        if not valid_cas.search(str(string)):
+        stripped = str(string).strip()
+        if not _fast_valid_cas(stripped):
             raise ValueError(f"Given input is not valid CAS formatting: '{string}'")
-        super().__init__(str(string))
+        obj = super().__new__(cls, string)
+        # Formatting is validated, so the stripped input is already the canonical form
+        obj._canonical = stripped
+        obj._digits = tuple(int(c) for c in stripped if c != "-")
+        # Weights run from len - 1 down to 1; `zip` stops before the check digit
+        total = 0
+        for weight, value in zip(range(len(obj._digits) - 1, 0, -1), obj._digits):
+            total += weight * value
+        obj._check_digit = total % 10
+        return obj
+
+    @property
+    def data(self) -> str:
+        """The CAS number as a plain `str`."""
+        return str.__str__(self)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, CASField):
-            return self.data == other.data
+            return str.__eq__(self, other)
         elif isinstance(other, (str, UserString)):
-            other_cas = CASField.from_string(str(other))
-            if other_cas is None:
-                return False
-            return self.data == other_cas.data
+            # Same normalization as `from_string`, but without building a new
+            # `CASField`; invalid strings just compare unequal.
+            return _normalize_cas_string(str(other)) == self.data and self.valid()
         return False
 
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = str.__hash__
+
     @staticmethod
     def from_string(string: str | None) -> "CASField | None":
         """Returns `None` if CAS number is invalid"""
         if string is None or not isinstance(string, (str, UserString)):
             return None
-        new_cas = CASField(string.strip().lstrip("0").strip())
-        if not new_cas.valid():
-            return None
-        return new_cas
+        return _cas_from_normalized_string(_normalize_cas_string(str(string)))
+
+    @staticmethod
+    def from_strings(strings: Sequence[str | None]) -> list["CASField | None"]:
+        """Same as ``[CASField.from_string(string) for string in strings]``.
+
+        The check digits of the whole column are validated at once with
+        `validate_many`, so only valid CAS numbers are built. Inputs which fail
+        go through `from_string`, which returns `None` for a wrong check digit
+        and raises for invalid formatting."""
+        normalized = [
+            (
+                _normalize_cas_string(str(string))
+                if isinstance(string, (str, UserString))
+                else None
+            )
+            for string in strings
+        ]
+        return [
+            CASField(string) if valid else CASField.from_string(string)
+            for string, valid in zip(normalized, CASField.validate_many(normalized))
+        ]
+
+    @staticmethod
+    def validate_many(strings: Sequence[str | None]) -> np.ndarray:
+        """Vectorized `CASField(string).valid()` for a column of strings.
+
+        Returns a boolean array with the same length as `strings`. Entries which
+        aren't strings or don't have valid CAS formatting are `False` instead of
+        raising an error."""
+        result = np.zeros(len(strings), dtype=bool)
+        positions, cleaned = [], []
+        for index, string in enumerate(strings):
+            if not isinstance(string, (str, UserString)):
+                continue
+            stripped = str(string).strip()
+            if _fast_valid_cas(stripped):
+                positions.append(index)
+                cleaned.append(stripped.replace("-", "").rjust(MAX_CAS_DIGITS, "0"))
+
+        if cleaned:
+            digits = np.frombuffer(
+                "".join(cleaned).encode("ascii"), dtype=np.uint8
+            ).reshape(-1, MAX_CAS_DIGITS) - ord("0")
+            expected = (digits[:, :-1] @ CHECK_DIGIT_WEIGHTS) % 10
+            result[positions] = expected == digits[:, -1]
+        return result
 
     @property
     def digits(self) -> list[int]:
-        return [int(d) for d in self.data.replace("-", "")]
+        return list(self._digits)
 
-    def export(self):
-        return "{}-{}-{}".format(
-            "".join([str(x) for x in self.digits[:-3]]),
-            "".join([str(x) for x in self.digits[-3:-1]]),
-            self.digits[-1],
-        )
+    def export(self) -> str:
+        return self._canonical
 
-    @cached_property
-    def check_digit_expected(self):
+    @property
+    def check_digit_expected(self) -> int:
         """
         Expected digit acording to https://www.cas.org/support/documentation/chemical-substances/checkdig algorithm
         """
-        result = (
-            sum(
-                [
-                    index * value
-                    for index, value in enumerate(self.digits[-2::-1], start=1)
-                ]
-            )
-            % 10
-        )
-        return result
+        return self._check_digit
+
+    def valid(self) -> bool:
+        # Formatting was already checked in `__init__`
+        return self._digits[-1] == self._check_digit
+
+
+@lru_cache(maxsize=8192)
+def _cas_from_normalized_string(string: str) -> CASField | None:
+    """Shared `CASField` instances for `CASField.from_string`.
 
-    def valid(self):
-        return (self.digits[-1] == self.check_digit_expected) and bool(
-            valid_cas.search(self.data)
-        )
+    CAS numbers repeat heavily across flow lists, so identical inputs reuse
+    one instance instead of being validated again."""
+    new_cas = CASField(string)
+    if not new_cas.valid():
+        return None
+    return new_cas
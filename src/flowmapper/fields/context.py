@@ -1,34 +1,73 @@
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any, Self
 
 from flowmapper.utils import as_normalized_tuple
 
-RESOURCE_CATEGORY = {
-    "natural resources",
-    "natural resource",
-    "resources",
-    "resource",
-    "land use",
-    "economic",
-    "social",
-    "raw materials",
-    "raw",
-}
+RESOURCE_CATEGORY = frozenset(
+    {
+        "natural resources",
+        "natural resource",
+        "resources",
+        "resource",
+        "land use",
+        "economic",
+        "social",
+        "raw materials",
+        "raw",
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_resource(value: str | tuple[str, ...]) -> bool:
+    if isinstance(value, str):
+        # Unsplit strings can have a resource category anywhere as a substring
+        lowered = value.lower()
+        return any(cat in lowered for cat in RESOURCE_CATEGORY)
+    return not RESOURCE_CATEGORY.isdisjoint(elem.lower() for elem in value)
 
 
 class ContextField:
+    __slots__ = ("value", "_hash", "_is_resource", "_normalized", "_exported")
+
+    # Shared instances for normalized context tuples; see `get`
+    _interned: dict[tuple[str, ...], "ContextField"] = {}
+
     def __init__(self, value: str | list[str] | tuple[str]):
         self.value = value
 
+    @classmethod
+    def get(cls, value: tuple[str, ...]) -> Self:
+        """Return the shared instance for the already normalized tuple `value`.
+
+        Flow lists only have a handful of distinct contexts, so normalized flows
+        share one `ContextField` per context instead of each allocating their own.
+        Shared instances must not be modified."""
+        try:
+            return cls._interned[value]
+        except KeyError:
+            obj = cls._interned[value] = cls(value=value)
+            obj._normalized = True
+            return obj
+
     def normalize(self, obj: Any | None = None, mapping: dict | None = None) -> Self:
-        return type(self)(value=as_normalized_tuple(value=obj or self.value))
+        # Normalization is idempotent, so shared instances from `get` are returned as is
+        if not obj and getattr(self, "_normalized", False):
+            return self
+        return type(self).get(as_normalized_tuple(value=obj or self.value))
 
     def is_resource(self) -> bool:
-        if isinstance(self.value, str):
-            return any(cat in self.value.lower() for cat in RESOURCE_CATEGORY)
-        else:
-            lowered = [elem.lower() for elem in self.value]
-            return any(cat in lowered for cat in RESOURCE_CATEGORY)
+        # Remembered per instance like `__hash__`; normalized contexts are
+        # shared, so most calls don't reach the `_is_resource` cache at all
+        try:
+            return self._is_resource
+        except AttributeError:
+            value = self.value
+            if isinstance(value, list):
+                value = tuple(value)
+            self._is_resource = _is_resource(value)
+            return self._is_resource
 
     def as_tuple(self) -> tuple | str:
         if isinstance(self.value, str):
@@ -36,21 +75,40 @@ class ContextField:
         return tuple(self.value)
 
     def export_as_string(self, join_character: str = "✂️"):
-        if isinstance(self.value, (list, tuple)):
-            return join_character.join(self.value)
-        return self.value
+        value = self.value
+        if not isinstance(value, (list, tuple)):
+            return value
+        # Exports join the shared context instances over and over with the
+        # same separator, so remember the last joined string
+        try:
+            exported_join, exported = self._exported
+            if exported_join == join_character:
+                return exported
+        except AttributeError:
+            pass
+        exported = join_character.join(value)
+        self._exported = (join_character, exported)
+        return exported
 
     def __iter__(self) -> Iterable:
         return iter(self.value)
 
     def __eq__(self, other: Any) -> bool:
-        if self and other and isinstance(other, ContextField):
-            return self.value == other.value
-        else:
-            try:
-                return self.value == self.normalize(other).value
-            except ValueError:
+        if self is other:
+            return True
+        if isinstance(other, ContextField):
+            if self and other:
+                return self.value == other.value
+            if self or other:
+                # A non-empty context never equals an empty one
                 return False
+        try:
+            return self.value == self.normalize(other).value
+        except ValueError:
+            return False
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
 
     def __repr__(self) -> str:
         return str(self.value)
@@ -59,7 +117,14 @@ class ContextField:
         return bool(self.value)
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        # Matching groups flows on tuples containing the context, and tuple
+        # hashes are not cached by Python, so remember ours. `value` is not
+        # changed after construction.
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self.value)
+            return self._hash
 
     def __contains__(self, other: Any) -> bool:
         """`self` context is more generic than the `other` context.
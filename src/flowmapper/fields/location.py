@@ -6,14 +6,16 @@ suffixes in flow names. Location codes are typically appended to flow names
 in the format ", <location>" where location is a recognized location code
 from the places.json data file.
 
-The module uses a compiled regex pattern (ends_with_location) to identify
-location codes at the end of strings, following the pattern of a comma,
-whitespace, and a recognized location code.
+Location codes at the end of strings follow the pattern of a comma,
+whitespace, and a recognized location code. The pattern is documented by the
+compiled regex ends_with_location; lookups use an equivalent string scan
+against the set of known codes.
 """
 
 import importlib.resources as resource
 import json
 import re
+from functools import cache
 from pathlib import Path
 
 import structlog
@@ -27,18 +29,75 @@ RESULTS_DIR = Path(__file__).parent.parent / "manual_matching" / "results"
 with resource.as_file(
     resource.files("flowmapper") / "data" / "places.json"
 ) as filepath:
-    places = json.load(open(filepath))
-
-# Compiled regex pattern that matches location codes at the end of strings.
-# Pattern matches: comma (not preceded by whitespace), one or more spaces,
-# followed by a recognized location code from places.json, optionally followed
-# by whitespace, at the end of the string.
-# The location code is captured in a named group "location".
-ends_with_location = re.compile(
-    r"(?<!\s),\s+(?P<location>{})\s*$".format(
-        "|".join([re.escape(string) for string in places])
-    ),
-)
+    places = json.loads(filepath.read_bytes())
+
+
+@cache
+def location_regex() -> re.Pattern:
+    """
+    Return the compiled regex that matches location codes at the end of strings.
+
+    Pattern matches: comma (not preceded by whitespace), one or more spaces,
+    followed by a recognized location code from places.json, optionally
+    followed by whitespace, at the end of the string. The location code is
+    captured in a named group "location".
+
+    Lookups in this module use `_location_suffix_span` instead, so the ~600-way
+    alternation is only compiled when something asks for it. Also available as
+    the module attribute ``ends_with_location``.
+    """
+    return re.compile(
+        r"(?<!\s),\s+(?P<location>{})\s*$".format(
+            "|".join([re.escape(string) for string in places])
+        ),
+    )
+
+
+def __getattr__(name: str):
+    if name == "ends_with_location":
+        return location_regex()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Set of location codes for the string-based suffix scan in
+# `_location_suffix_span`, which finds the same matches as `ends_with_location`
+# without running the ~600-way alternation at every position of the string.
+places_set = frozenset(places)
+# Only the last `max_place_commas + 1` commas of a string can start a suffix
+max_place_commas = max(place.count(",") for place in places)
+
+
+def _location_suffix_span(string: str) -> tuple[int, int, int] | None:
+    """
+    Find the location suffix that `ends_with_location` would match.
+
+    Returns ``(match_start, location_start, location_end)`` for the leftmost
+    comma that is not preceded by whitespace, is followed by whitespace, and
+    whose remainder (stripped) is a recognized location code; None otherwise.
+    """
+    # Anchor on the last comma and step back over at most as many commas as
+    # a location code can contain, then scan forward for the leftmost match
+    index = string.rfind(",")
+    for _ in range(max_place_commas):
+        if index <= 0:
+            break
+        previous = string.rfind(",", 0, index)
+        if previous == -1:
+            break
+        index = previous
+    while index != -1:
+        if (index == 0 or not string[index - 1].isspace()) and string[
+            index + 1 : index + 2
+        ].isspace():
+            rest = string[index + 1 :]
+            location = rest.strip()
+            if location in places_set:
+                start = index + 1 + (len(rest) - len(rest.lstrip()))
+                return index, start, start + len(location)
+        index = string.find(",", index + 1)
+    return None
+
+
 # All solutions I found for returning original string instead of
 # lower case one were very ugly
 # location_reverser = {obj.lower(): obj for obj in places}
@@ -58,11 +117,6 @@ ends_with_location = re.compile(
 #     ),
 # )
 
-with resource.as_file(
-    resource.files("flowmapper") / "data" / "names_and_locations.json"
-) as filepath:
-    names_and_locations = {o["source"]: o for o in json.load(open(filepath))}
-
 
 def split_location_suffix(string: str) -> tuple[str, str | None]:
     """
@@ -103,8 +157,8 @@ def split_location_suffix(string: str) -> tuple[str, str | None]:
     >>> split_location_suffix(", NL")
     ('', 'NL')
     """
-    if match := ends_with_location.search(string):
-        return string[: match.start()], match.group("location")
+    if span := _location_suffix_span(string):
+        return string[: span[0]], string[span[1] : span[2]]
     return string, None
 
 
@@ -144,10 +198,6 @@ def replace_location_suffix(string: str, new_location: str) -> str:
         ...
     MissingLocation: No location suffix found in string 'Ammonia'
     """
-    if match := ends_with_location.search(string):
-        return (
-            string[: match.start("location")]
-            + new_location
-            + string[match.end("location") :]
-        )
+    if span := _location_suffix_span(string):
+        return string[: span[1]] + new_location + string[span[2] :]
     raise MissingLocation(f"No location suffix found in string {string!r}")
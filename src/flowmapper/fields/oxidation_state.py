@@ -13,6 +13,8 @@ numbers_optional_parentheses = re.compile(
 
 
 class OxidationState:
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
@@ -29,30 +31,38 @@ class OxidationState:
         return str(self.value)
 
     @staticmethod
-    def has_oxidation_state(obj: str) -> bool:
+    def match(obj: str) -> re.Match | None:
+        """Return the oxidation state suffix match for `obj`, if any.
+
+        Roman numerals are tried first; the numeric pattern only runs when they
+        don't match. Pass the result to `from_string` to avoid searching twice."""
         return roman_numberals_optional_parentheses.search(
             obj
         ) or numbers_optional_parentheses.search(obj)
 
+    @staticmethod
+    def has_oxidation_state(obj: str) -> bool:
+        return OxidationState.match(obj) is not None
+
     @classmethod
-    def from_string(cls, obj: str) -> tuple[Self, str]:
-        if match := roman_numberals_optional_parentheses.search(obj):
-            obj_dict = match.groupdict()
+    def from_string(cls, obj: str, match: re.Match | None = None) -> tuple[Self, str]:
+        if match is None:
+            match = cls.match(obj)
+        if match is None:
+            raise ValueError("No match found")
+
+        obj_dict = match.groupdict()
+        if match.re is roman_numberals_optional_parentheses:
             try:
                 value = roman.fromRoman(obj_dict["numeral"].upper())
             except roman.InvalidRomanNumeralError:
                 raise ValueError(
                     f"{obj_dict['numeral']} in string {obj} is not a valid roman numeral"
                 )
-            if "-" in obj_dict["sign"]:
-                value *= -1
-        elif match := numbers_optional_parentheses.search(obj):
-            obj_dict = match.groupdict()
-            value = eval(obj_dict["numeral"].lstrip("0"))
-            if "-" in obj_dict["sign"]:
-                value *= -1
         else:
-            raise ValueError("No match found")
+            value = int(obj_dict["numeral"])
+        if "-" in obj_dict["sign"]:
+            value *= -1
 
         if value < -5 or value > 9:
             raise ValueError(
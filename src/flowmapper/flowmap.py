@@ -2,8 +2,9 @@ from collections import Counter
 from collections.abc import Callable
 from functools import cached_property
 from pathlib import Path
-from time import time
+from time import perf_counter
 
+import numpy as np
 import pandas as pd
 import randonneur
 from structlog import get_logger
@@ -17,6 +18,42 @@ from flowmapper.utils import apply_transformation_and_convert_flows_to_normalize
 
 logger = get_logger("flowmapper")
 
+GLAD_COLUMNS = (
+    "SourceFlowName",
+    "SourceFlowUUID",
+    "SourceFlowContext",
+    "SourceUnit",
+    "MatchCondition",
+    "ConversionFactor",
+    "TargetFlowName",
+    "TargetFlowUUID",
+    "TargetFlowContext",
+    "TargetUnit",
+    "MemoMapper",
+)
+
+# Indexed by 2 * (source occurs in more than one mapping) + (target occurs in
+# more than one mapping)
+CARDINALITY_LABELS = np.array(["1:1", "N:1", "1:N", "N:M"], dtype=object)
+
+
+def _context_statistics(matched: Counter, total: Counter) -> pd.DataFrame:
+    """Build the per-context matching statistics table from two tallies.
+
+    Both counters are read once into aligned columns, so no merge is needed to
+    line up contexts which only occur in one of them.
+    """
+    contexts = list(dict.fromkeys([*total, *matched]))
+    df = pd.DataFrame(
+        {
+            "context": contexts,
+            "matched": [matched[context] for context in contexts],
+            "total": [total[context] for context in contexts],
+        }
+    )
+    df["percent"] = df["matched"] / df["total"]
+    return df.sort_values("percent")
+
 
 class Flowmap:
     """
@@ -158,22 +195,45 @@ class Flowmap:
         self.matches = []
 
     @cached_property
-    def _matched_source_flows_ids(self) -> set[int]:
+    def _matched_source_flows_ids(self) -> frozenset[int]:
         """Get a set of source flow IDs that have been matched.
 
         Returns
         -------
-        set[int]
+        frozenset[int]
             Set of internal IDs (_id) from source flows that appear in matches.
             Empty set if no matches exist.
 
         Notes
         -----
-        - This is a cached property used internally by `matched_source()` and
-          `unmatched_source` to efficiently determine which flows have been matched
+        - This is a cached property used internally by `_source_partition` to
+          efficiently determine which flows have been matched
         - The cache is invalidated when `matches` changes
         """
-        return {match.source._id for match in self.matches}
+        return frozenset(match.source._id for match in self.matches)
+
+    @cached_property
+    def _source_partition(
+        self,
+    ) -> tuple[list[NormalizedFlow], list[NormalizedFlow]]:
+        """Split the source flows into matched and unmatched flows in one pass.
+
+        Returns
+        -------
+        tuple[list[NormalizedFlow], list[NormalizedFlow]]
+            The matched and the unmatched source flows, each in the order of
+            `source_flows`.
+
+        Notes
+        -----
+        - Shared by `matched_source()` and `unmatched_source`
+        - The cache is invalidated by `generate_matches()`
+        """
+        matched_ids = self._matched_source_flows_ids
+        matched, unmatched = [], []
+        for flow in self.source_flows:
+            (matched if flow.id in matched_ids else unmatched).append(flow)
+        return matched, unmatched
 
     def generate_matches(self) -> None:
         """Generate matches by applying all matching rules sequentially.
@@ -193,7 +253,9 @@ class Flowmap:
         Notes
         -----
         - Rules are applied in the order they appear in `self.rules`
-        - Each rule only receives source flows that haven't been matched yet
+        - Each rule only receives source flows that haven't been matched yet;
+          this list is only filtered again after a rule which found matches
+        - Cached properties derived from the matches are reset afterwards
         - New target flows are automatically normalized before being added
         - The method logs information about each rule's performance
 
@@ -208,13 +270,15 @@ class Flowmap:
         >>> len(flowmap.matches)
         1
         """
+        # Only rules which found matches can have changed the `matched` flags,
+        # so the unmatched source flows are filtered again only after those
+        unmatched = [flow for flow in self.source_flows if not flow.matched]
         for rule in self.rules:
-            start = time()
-            result = rule(
-                source_flows=[flow for flow in self.source_flows if not flow.matched],
-                target_flows=self.target_flows,
-            )
-            elapsed = time() - start
+            start = perf_counter()
+            result = rule(source_flows=unmatched, target_flows=self.target_flows)
+            elapsed = perf_counter() - start
+            if result:
+                unmatched = [flow for flow in unmatched if not flow.matched]
 
             if new_target_flows := [
                 obj.target for obj in result if obj.new_target_flow
@@ -229,6 +293,8 @@ class Flowmap:
                 )
             self.matches.extend(result)
 
+        self._invalidate_match_caches()
+
     def add_new_target_flows(self, flows: list[Flow]) -> None:
         """Add new target flows to the target flow list.
 
@@ -246,7 +312,8 @@ class Flowmap:
         Notes
         -----
         - The flows are normalized using `apply_transformation_and_convert_flows_to_normalized_flows`
-        - Normalized flows are appended to `self.target_flows`
+        - Normalized flows are appended to `self.target_flows`, and cached
+          statistics are reset
         - This method is typically called automatically during `generate_matches()`
 
         Examples
@@ -264,6 +331,17 @@ class Flowmap:
             functions=self.data_preparation_functions, flows=flows
         )
         self.target_flows.extend(normalized_flows)
+        self._invalidate_match_caches()
+
+    def _invalidate_match_caches(self) -> None:
+        """Drop cached properties derived from the matches or the flow lists."""
+        for name in (
+            "_matched_source_flows_ids",
+            "_source_partition",
+            "unmatched_source",
+            "matched_target_statistics",
+        ):
+            self.__dict__.pop(name, None)
 
     def matched_source(self) -> list[NormalizedFlow]:
         """Get a list of source flows that have been successfully matched.
@@ -280,8 +358,8 @@ class Flowmap:
 
         Notes
         -----
-        - Uses the `_matched_source_flows_ids` cached property to determine
-          which flows have been matched
+        - Uses the `_source_partition` cached property, which splits the
+          source flows into matched and unmatched flows in a single pass
         - Returns flows in the same order as they appear in `source_flows`
         - Call `generate_matches()` first to populate matches
 
@@ -294,12 +372,7 @@ class Flowmap:
         >>> matched[0].matched
         True
         """
-        result = [
-            flow
-            for flow in self.source_flows
-            if flow.id in self._matched_source_flows_ids
-        ]
-        return result
+        return list(self._source_partition[0])
 
     @cached_property
     def unmatched_source(self) -> list[NormalizedFlow]:
@@ -318,8 +391,8 @@ class Flowmap:
         Notes
         -----
         - This is a cached property, so it's computed once and cached
-        - Uses the `_matched_source_flows_ids` cached property to determine
-          which flows have been matched
+        - Uses the `_source_partition` cached property, which splits the
+          source flows into matched and unmatched flows in a single pass
         - Returns flows in the same order as they appear in `source_flows`
         - The cache is invalidated if the `matches` list changes
 
@@ -330,12 +403,7 @@ class Flowmap:
         >>> len(unmatched)
         0
         """
-        result = [
-            flow
-            for flow in self.source_flows
-            if flow.id not in self._matched_source_flows_ids
-        ]
-        return result
+        return self._source_partition[1]
 
     def matched_source_statistics(self) -> pd.DataFrame:
         """Calculate matching statistics grouped by source flow context.
@@ -369,22 +437,10 @@ class Flowmap:
         >>> stats.columns.tolist()
         ['context', 'matched', 'total', 'percent']
         """
-        matched = pd.Series(
-            Counter([flow.source.context.value for flow in self.matches])
-        ).reset_index()
-        matched.columns = ["context", "matched"]
-
-        total = pd.Series(
-            Counter([flow.original.context.value for flow in self.source_flows])
-        ).reset_index()
-        total.columns = ["context", "total"]
-
-        df = pd.merge(matched, total, on="context", how="outer")
-        df = df.fillna(0).astype({"matched": "int", "total": "int"})
-
-        df["percent"] = df.matched / df.total
-        result = df.sort_values("percent")
-        return result
+        return _context_statistics(
+            matched=Counter(match.source.context.value for match in self.matches),
+            total=Counter(flow.original.context.value for flow in self.source_flows),
+        )
 
     @cached_property
     def matched_target_statistics(self) -> pd.DataFrame:
@@ -421,22 +477,10 @@ class Flowmap:
         >>> stats.columns.tolist()
         ['context', 'matched', 'total', 'percent']
         """
-        matched = pd.Series(
-            Counter([flow.target.context.value for flow in self.matches])
-        ).reset_index()
-        matched.columns = ["context", "matched"]
-
-        total = pd.Series(
-            Counter([flow.original.context.value for flow in self.target_flows])
-        ).reset_index()
-        total.columns = ["context", "total"]
-
-        df = pd.merge(matched, total, on="context", how="outer")
-        df = df.fillna(0).astype({"matched": "int", "total": "int"})
-
-        df["percent"] = df.matched / df.total
-        result = df.sort_values("percent")
-        return result
+        return _context_statistics(
+            matched=Counter(match.target.context.value for match in self.matches),
+            total=Counter(flow.original.context.value for flow in self.target_flows),
+        )
 
     def print_statistics(self) -> None:
         """Print summary statistics for the flow mapping process.
@@ -451,7 +495,7 @@ class Flowmap:
         Notes
         -----
         - Percentage is calculated as matches / source_flows
-        - Cardinalities are computed by `cardinalities()` method
+        - Cardinalities are counted from the same labels as `cardinalities()`
         - This method prints to stdout, so it's suitable for interactive use
           but may need to be captured or redirected in automated contexts
 
@@ -463,7 +507,7 @@ class Flowmap:
         1 mappings (100.00% of total).
         Mappings cardinalities: {'1:1': 1}
         """
-        cardinalities = dict(Counter([x["cardinality"] for x in self.cardinalities()]))
+        cardinalities = dict(Counter(self._cardinality_labels()[1]))
         percentage = (
             len(self.matches) / len(self.source_flows) if self.source_flows else 0.0
         )
@@ -504,25 +548,39 @@ Mappings cardinalities: {str(cardinalities)}"""
         >>> card[0]
         {'from': 0, 'to': 0, 'cardinality': '1:1'}
         """
-        mappings = [(match.source._id, match.target._id) for match in self.matches]
-        lhs_counts = Counter([pair[0] for pair in mappings])
-        rhs_counts = Counter([pair[1] for pair in mappings])
-
-        result = []
-
-        for lhs, rhs in mappings:
-            lhs_count = lhs_counts[lhs]
-            rhs_count = rhs_counts[rhs]
-            if lhs_count == 1 and rhs_count == 1:
-                result.append({"from": lhs, "to": rhs, "cardinality": "1:1"})
-            elif lhs_count == 1 and rhs_count > 1:
-                result.append({"from": lhs, "to": rhs, "cardinality": "N:1"})
-            elif lhs_count > 1 and rhs_count == 1:
-                result.append({"from": lhs, "to": rhs, "cardinality": "1:N"})
-            elif lhs_count > 1 and rhs_count > 1:
-                result.append({"from": lhs, "to": rhs, "cardinality": "N:M"})
-
-        return sorted(result, key=lambda x: x["from"])
+        mappings, labels = self._cardinality_labels()
+        return [
+            {"from": lhs, "to": rhs, "cardinality": label}
+            for (lhs, rhs), label in zip(mappings, labels)
+        ]
+
+    def _cardinality_labels(self) -> tuple[list[tuple[int, int]], list[str]]:
+        """Classify each mapping without building the `cardinalities()` rows.
+
+        Returns
+        -------
+        tuple[list[tuple[int, int]], list[str]]
+            The (source ID, target ID) pairs sorted by source ID, and the
+            cardinality label of each pair.
+        """
+        if not self.matches:
+            return [], []
+        pairs = np.array(
+            [(match.source._id, match.target._id) for match in self.matches],
+            dtype=np.int64,
+        )
+        pairs = pairs[np.argsort(pairs[:, 0], kind="stable")]
+        _, lhs, lhs_counts = np.unique(
+            pairs[:, 0], return_inverse=True, return_counts=True
+        )
+        _, rhs, rhs_counts = np.unique(
+            pairs[:, 1], return_inverse=True, return_counts=True
+        )
+        labels = CARDINALITY_LABELS[
+            (lhs_counts[lhs] > 1) * 2 + (rhs_counts[rhs] > 1)
+        ].tolist()
+        mappings = [tuple(pair) for pair in pairs.tolist()]
+        return mappings, labels
 
     def to_randonneur(
         self,
@@ -662,43 +720,54 @@ Mappings cardinalities: {str(cardinalities)}"""
         >>> # Export to Excel
         >>> flowmap.to_glad(path=Path("mapping.xlsx"))
         """
-        data = []
+        missing_id = "" if ensure_id else None
+        columns = {name: [] for name in GLAD_COLUMNS}
+        (
+            source_names,
+            source_uuids,
+            source_contexts,
+            source_units,
+            conditions,
+            conversion_factors,
+            target_names,
+            target_uuids,
+            target_contexts,
+            target_units,
+            comments,
+        ) = columns.values()
+
         for match in self.matches:
-            data.append(
-                {
-                    "SourceFlowName": str(match.source.name),
-                    "SourceFlowUUID": match.source.identifier
-                    or ("" if ensure_id else None),
-                    "SourceFlowContext": match.source.context.export_as_string(
-                        join_character="/"
-                    ),
-                    "SourceUnit": str(match.source.unit),
-                    "MatchCondition": match.condition.as_glad(),
-                    "ConversionFactor": match.conversion_factor,
-                    "TargetFlowName": str(match.target.name),
-                    "TargetFlowUUID": match.target.identifier
-                    or ("" if ensure_id else None),
-                    "TargetFlowContext": match.target.context.export_as_string(
-                        join_character="/"
-                    ),
-                    "TargetUnit": str(match.target.unit),
-                    "MemoMapper": match.comment,
-                }
-            )
+            source, target = match.source, match.target
+            source_names.append(str(source.name))
+            source_uuids.append(source.identifier or missing_id)
+            source_contexts.append(source.context.export_as_string(join_character="/"))
+            source_units.append(str(source.unit))
+            conditions.append(match.condition.as_glad())
+            conversion_factors.append(match.conversion_factor)
+            target_names.append(str(target.name))
+            target_uuids.append(target.identifier or missing_id)
+            target_contexts.append(target.context.export_as_string(join_character="/"))
+            target_units.append(str(target.unit))
+            comments.append(match.comment)
 
         if missing_source:
-            for flow_obj in filter(lambda x: not x.matched, self.source_flows):
-                data.append(
-                    {
-                        "SourceFlowName": str(flow_obj.original.name),
-                        "SourceFlowUUID": flow_obj.original.identifier
-                        or ("" if ensure_id else None),
-                        "SourceFlowContext": flow_obj.original.context.export_as_string(),
-                        "SourceUnit": str(flow_obj.original.unit),
-                    }
-                )
-
-        result = pd.DataFrame(data)
+            unmatched = [
+                flow_obj.original
+                for flow_obj in self.source_flows
+                if not flow_obj.matched
+            ]
+            for original in unmatched:
+                source_names.append(str(original.name))
+                source_uuids.append(original.identifier or missing_id)
+                source_contexts.append(original.context.export_as_string())
+                source_units.append(str(original.unit))
+            for name in GLAD_COLUMNS[4:]:
+                columns[name].extend([None] * len(unmatched))
+
+        if not self.matches:
+            # Only source flow columns are filled, and none at all without rows
+            columns = {name: columns[name] for name in GLAD_COLUMNS[:4] if source_names}
+        result = pd.DataFrame(columns)
 
         if not path:
             return result
@@ -706,18 +775,16 @@ Mappings cardinalities: {str(cardinalities)}"""
             path = Path(path)
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            writer = pd.ExcelWriter(
+            # Not using xlsxwriter's `constant_memory` option: it only accepts
+            # cells row by row, but pandas writes them column by column
+            with pd.ExcelWriter(
                 path,
                 engine="xlsxwriter",
                 engine_kwargs={"options": {"strings_to_formulas": False}},
-            )
-            result.to_excel(writer, sheet_name="Mapping", index=False, na_rep="NaN")
-
-            for column in result:
-                column_length = max(
-                    result[column].astype(str).map(len).max(), len(column)
-                )
-                col_idx = result.columns.get_loc(column)
-                writer.sheets["Mapping"].set_column(col_idx, col_idx, column_length)
+            ) as writer:
+                result.to_excel(writer, sheet_name="Mapping", index=False, na_rep="NaN")
 
-            writer.close()
+                sheet = writer.sheets["Mapping"]
+                widths = result.astype(str).apply(lambda column: column.str.len().max())
+                for col_idx, (column, width) in enumerate(widths.items()):
+                    sheet.set_column(col_idx, col_idx, max(width, len(column)))
@@ -64,12 +64,12 @@ def flowmapper(
         else:
             raise ValueError(f"Can't understand transformation {obj}")
 
-    original_source_flows = [Flow.from_dict(obj) for obj in json.load(open(source))]
+    original_source_flows = Flow.from_dicts(json.load(open(source)))
     source_flows = apply_transformation_and_convert_flows_to_normalized_flows(
         functions=transformation_functions, flows=original_source_flows
     )
 
-    original_target_flows = [Flow.from_dict(obj) for obj in json.load(open(target))]
+    original_target_flows = Flow.from_dicts(json.load(open(target)))
     target_flows = apply_transformation_and_convert_flows_to_normalized_flows(
         functions=transformation_functions, flows=original_target_flows
     )
@@ -14,6 +14,15 @@ from flowmapper.matching.core import get_matches
 from flowmapper.utils import toolz
 
 
+def _name_context_key(flow: NormalizedFlow) -> tuple:
+    """Grouping key for flows which must share name, context, oxidation state and location.
+
+    Matching functions group both source and target flows on keys like this one,
+    and look up the targets for each source group in a dict instead of scanning
+    every target flow per group."""
+    return (flow.name, flow.context, flow.oxidation_state, flow.location)
+
+
 def match_identical_identifier(
     source_flows: list[NormalizedFlow],
     target_flows: list[NormalizedFlow],
@@ -45,6 +54,9 @@ def match_identical_identifier(
     - Match condition is always MatchCondition.exact
     """
     matches = []
+    targets_by_identifier = toolz.itertoolz.groupby(
+        lambda x: x.identifier, target_flows
+    )
 
     for source_id, sources in toolz.itertoolz.groupby(
         lambda x: x.identifier, source_flows
@@ -56,9 +68,7 @@ def match_identical_identifier(
                 source_flows=sources,
                 # Filter target flows with matching identifier. We don't need to worry about
                 # duplicate identifiers as `get_matches` will only allow a single result target
-                target_flows=[
-                    flow for flow in target_flows if source_id == flow.identifier
-                ],
+                target_flows=targets_by_identifier.get(source_id, []),
                 comment=f"Shared target-unique identifier: {source_id}",
                 function_name="match_identical_identifier",
                 match_condition=MatchCondition.exact,
@@ -98,19 +108,18 @@ def match_identical_cas_numbers(
     """
     matches = []
 
+    def key(x):
+        return (x.cas_number, x.context, x.location)
+
+    targets_by_key = toolz.itertoolz.groupby(key, target_flows)
+
     for (cas_number, context, location), sources in toolz.itertoolz.groupby(
-        lambda x: (x.cas_number, x.context, x.location), source_flows
+        key, source_flows
     ).items():
         matches.extend(
             get_matches(
                 source_flows=sources,
-                target_flows=[
-                    flow
-                    for flow in target_flows
-                    if flow.cas_number == cas_number
-                    and flow.context == context
-                    and flow.location == location
-                ],
+                target_flows=targets_by_key.get((cas_number, context, location), []),
                 comment=f"Shared CAS code with identical context and location: {cas_number}",
                 function_name="match_identical_cas_numbers",
                 match_condition=MatchCondition.exact,
@@ -154,21 +163,16 @@ def match_identical_names(
     - Only unit-compatible flows are matched
     """
     matches = []
+    targets_by_key = toolz.itertoolz.groupby(_name_context_key, target_flows)
 
-    for (name, context, oxidation_state, location), sources in toolz.itertoolz.groupby(
-        lambda x: (x.name, x.context, x.oxidation_state, x.location), source_flows
+    for key, sources in toolz.itertoolz.groupby(
+        _name_context_key, source_flows
     ).items():
+        name = key[0]
         matches.extend(
             get_matches(
                 source_flows=sources,
-                target_flows=[
-                    target
-                    for target in target_flows
-                    if target.name == name
-                    and target.context == context
-                    and target.oxidation_state == oxidation_state
-                    and target.location == location
-                ],
+                target_flows=targets_by_key.get(key, []),
                 comment=comment
                 or f"Shared normalized name with identical context, oxidation state, and location: {name}",
                 function_name=function_name or "match_identical_names",
@@ -274,22 +278,21 @@ def match_identical_names_lowercase(
     - Only unit-compatible flows are matched
     """
     matches = []
+    targets_by_key = toolz.itertoolz.groupby(
+        lambda x: (x.name.lower(), x.context, x.oxidation_state, x.location),
+        target_flows,
+    )
 
     for (name, context, oxidation_state, location), sources in toolz.itertoolz.groupby(
-        lambda x: (x.name, x.context, x.oxidation_state, x.location), source_flows
+        _name_context_key, source_flows
     ).items():
         name = name.lower()
         matches.extend(
             get_matches(
                 source_flows=sources,
-                target_flows=[
-                    flow
-                    for flow in target_flows
-                    if flow.name.lower() == name
-                    and flow.context == context
-                    and flow.oxidation_state == oxidation_state
-                    and flow.location == location
-                ],
+                target_flows=targets_by_key.get(
+                    (name, context, oxidation_state, location), []
+                ),
                 comment=comment
                 or f"Shared normalized lowercase name with identical context, oxidation state, and location: {name}",
                 function_name=function_name or "match_identical_names_lowercase",
@@ -332,21 +335,20 @@ def match_identical_names_without_commas(
     - Only unit-compatible flows are matched
     """
     matches = []
+    targets_by_key = toolz.itertoolz.groupby(
+        lambda x: (x.name.replace(",", ""), x.context, x.oxidation_state, x.location),
+        target_flows,
+    )
 
     for (name, context, oxidation_state, location), sources in toolz.itertoolz.groupby(
-        lambda x: (x.name, x.context, x.oxidation_state, x.location), source_flows
+        _name_context_key, source_flows
     ).items():
         matches.extend(
             get_matches(
                 source_flows=sources,
-                target_flows=[
-                    flow
-                    for flow in target_flows
-                    if flow.name.replace(",", "") == name.replace(",", "")
-                    and flow.context == context
-                    and flow.oxidation_state == oxidation_state
-                    and flow.location == location
-                ],
+                target_flows=targets_by_key.get(
+                    (name.replace(",", ""), context, oxidation_state, location), []
+                ),
                 comment=f"Shared normalized name with commas removed and identical context, oxidation state, and location: {name}",
                 match_condition=MatchCondition.close,
                 function_name="match_identical_names_without_commas",
@@ -445,23 +447,23 @@ def match_identical_names_target_uuid_identifier(
     1
     """
     matches = []
-
-    for (name, context, oxidation_state, location), sources in toolz.itertoolz.groupby(
-        lambda x: (x.name, x.context, x.oxidation_state, x.location), source_flows
+    targets_by_key = toolz.itertoolz.groupby(
+        _name_context_key,
+        (
+            target
+            for target in target_flows
+            if target.identifier is not None and is_uuid.match(target.identifier)
+        ),
+    )
+
+    for key, sources in toolz.itertoolz.groupby(
+        _name_context_key, source_flows
     ).items():
+        name = key[0]
         matches.extend(
             get_matches(
                 source_flows=sources,
-                target_flows=[
-                    target
-                    for target in target_flows
-                    if target.name == name
-                    and target.context == context
-                    and target.oxidation_state == oxidation_state
-                    and target.location == location
-                    and target.identifier is not None
-                    and is_uuid.match(target.identifier)
-                ],
+                target_flows=targets_by_key.get(key, []),
                 comment=comment
                 or f"Shared normalized name with identical context, oxidation state, and location: {name}",
                 function_name=function_name
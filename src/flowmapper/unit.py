@@ -2,6 +2,7 @@ import importlib.resources as resource
 import json
 import math
 from collections import UserString
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Self
 
@@ -23,18 +24,10 @@ with open(Path(__file__).parent / "data" / "standard-units-harmonization.json")
 
 class UnitField(UserString):
     def normalize(self) -> Self:
-        """Normalize string to fit into our `pint` definitions"""
-        label = normalize_str(self.data)
-        if label in UNIT_MAPPING:
-            label = UNIT_MAPPING[label]
-        try:
-            ureg(label)
-        except errors.UndefinedUnitError:
-            raise ValueError(
-                f"Unit {label} is unknown; add to flowmapper `units.txt` or define a mapping in `unit-mapping.json`"
-            )
-        # Makes type checkers happy, if inelegant...
-        return type(self)(label)
+        """Normalize string to fit into our `pint` definitions.
+
+        Returns a shared instance for each distinct input unit string."""
+        return _normalize_unit(type(self), self.data)
 
     def is_uri(self, value: str) -> bool:
         # Placeholder for when we support glossary entries
@@ -64,3 +57,18 @@ class UnitField(UserString):
             except (errors.DimensionalityError, errors.UndefinedUnitError):
                 result = float("nan")
         return result
+
+
+@lru_cache(maxsize=4096)
+def _normalize_unit(cls: type[UnitField], data: str) -> UnitField:
+    label = normalize_str(data)
+    if label in UNIT_MAPPING:
+        label = UNIT_MAPPING[label]
+    try:
+        ureg(label)
+    except errors.UndefinedUnitError:
+        raise ValueError(
+            f"Unit {label} is unknown; add to flowmapper `units.txt` or define a mapping in `unit-mapping.json`"
+        )
+    # Makes type checkers happy, if inelegant...
+    return cls(label)
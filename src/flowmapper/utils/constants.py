@@ -14,7 +14,7 @@ RESULTS_DIR = Path(__file__).parent.parent / "manual_matching" / "results"
 with resource.as_file(
     resource.files("flowmapper") / "data" / "names_and_locations.json"
 ) as filepath:
-    names_and_locations = {o["source"]: o for o in json.load(open(filepath))}
+    names_and_locations = {o["source"]: o for o in json.loads(filepath.read_bytes())}
 
 try:
     import cytoolz as toolz
@@ -1,5 +1,6 @@
 """Context-related utility functions."""
 
+from functools import lru_cache
 from typing import Any
 
 MISSING_VALUES = {
@@ -13,11 +14,25 @@ MISSING_VALUES = {
 
 
 def as_normalized_tuple(value: Any) -> tuple[str]:
-    """Convert context inputs to normalized tuple form."""
-    if isinstance(value, (tuple, list)):
+    """Convert context inputs to normalized tuple form.
+
+    Results are cached, as the same few context values occur over and over in flow lists.
+    """
+    if isinstance(value, list):
+        value = tuple(value)
+    try:
+        return _as_normalized_tuple(value)
+    except TypeError:
+        # Unhashable input; normalize without the cache
+        return _as_normalized_tuple.__wrapped__(value)
+
+
+@lru_cache(maxsize=4096)
+def _as_normalized_tuple(value: str | tuple) -> tuple[str]:
+    if isinstance(value, tuple):
         intermediate = value
     elif isinstance(value, str) and "/" in value:
-        intermediate = list(value.split("/"))
+        intermediate = value.split("/")
     elif isinstance(value, str):
         intermediate = [value]
     else:
@@ -25,12 +40,12 @@ def as_normalized_tuple(value: Any) -> tuple[str]:
 
     intermediate = [elem.lower().strip() for elem in intermediate]
 
-    while intermediate and intermediate[-1] in MISSING_VALUES:
-        if len(intermediate) == 1:
-            break
-        intermediate = intermediate[:-1]
+    # Drop trailing missing values, but always keep the first element
+    end = len(intermediate)
+    while end > 1 and intermediate[end - 1] in MISSING_VALUES:
+        end -= 1
 
-    return tuple(intermediate)
+    return tuple(intermediate[:end])
 
 
 def tupleize_context(obj: dict) -> dict:
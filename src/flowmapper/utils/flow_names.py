@@ -18,7 +18,7 @@ unit_slash = re.compile(r"/(?P<unit>m3|kg)(\,?\s+|\s+|$)")
 def remove_unit_slash(obj: Flow) -> str:
     """Remove unit references from flow names that appear as '/unit' suffix."""
     name = obj.name.data
-    if match := unit_slash.search(name):
+    if "/" in name and (match := unit_slash.search(name)):
         obj_dict = match.groupdict()
         if match.end() == len(name):
             name = name[: match.start()]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 from collections.abc import Callable
 from functools import partial
 from typing import TYPE_CHECKING
@@ -108,7 +107,7 @@ def apply_transformation_and_convert_flows_to_normalized_flows(
         List of NormalizedFlow objects, one for each input flow. Each NormalizedFlow contains:
         - `original`: The original Flow object (unchanged)
         - `normalized`: The transformed and normalized Flow object
-        - `current`: A copy of the normalized Flow object
+        - `current`: The normalized Flow object (shared, as flows are frozen)
 
     Examples
     --------
@@ -140,9 +139,9 @@ def apply_transformation_and_convert_flows_to_normalized_flows(
     for function in functions:
         flow_dicts = function(graph=flow_dicts)
 
-    normalized_flows = [Flow.from_dict(obj).normalize() for obj in flow_dicts]
+    normalized_flows = Flow.normalize_many(Flow.from_dicts(flow_dicts))
 
     return [
-        NormalizedFlow(original=o, normalized=n, current=copy.copy(n))
+        NormalizedFlow(original=o, normalized=n, current=n)
         for o, n in zip(flows, normalized_flows)
     ]
@@ -1,6 +1,10 @@
+from copy import copy
+from unittest.mock import patch
+
 import pytest
 
 from flowmapper.domain.flow import Flow
+from flowmapper.fields import ContextField
 
 
 class TestFlowRepr:
@@ -504,6 +508,21 @@ class TestFlowRandonneurMapping:
         assert "expression language" in result, "Expected expression language key"
         assert "labels" in result, "Expected labels key"
 
+    def test_randonneur_mapping_returns_independent_copies(self):
+        """Test changing one returned mapping does not affect later calls."""
+        first = Flow.randonneur_mapping()
+        first["labels"]["name"] = "$.other"
+        first["expression language"] = "XPath"
+        second = Flow.randonneur_mapping()
+
+        assert first is not second, "Expected a new mapping on every call"
+        assert (
+            second["labels"]["name"] == "$.name"
+        ), f"Expected unchanged name label, got {second['labels']['name']!r}"
+        assert (
+            second["expression language"] == "JSONPath"
+        ), "Expected unchanged expression language"
+
     def test_randonneur_mapping_expression_language(self):
         """Test randonneur_mapping has correct expression language."""
         result = Flow.randonneur_mapping()
@@ -575,6 +594,32 @@ class TestFlowEquality:
         assert flow != 123, "Expected flow to not equal number"
         assert flow != None, "Expected flow to not equal None"  # noqa: E711
 
+    def test_hash_usable_in_sets_with_synonyms(self):
+        """Test flows can be hashed even when they have list synonyms."""
+        flow1 = Flow.from_dict(
+            {
+                "name": "Carbon dioxide",
+                "context": "air",
+                "unit": "kg",
+                "synonyms": ["CO2"],
+            }
+        )
+        flow2 = Flow.from_dict(
+            {"name": "Carbon dioxide", "context": "air", "unit": "kg"}
+        )
+
+        assert hash(flow1) == hash(flow1), "Expected flow hash to be stable"
+        assert len({flow1, flow2, flow1}) == 2, "Expected two distinct flows in set"
+
+    def test_copy_of_slotted_flow(self):
+        """Test frozen slotted flows have no __dict__ and still copy cleanly."""
+        flow = Flow.from_dict({"name": "Ammonia", "context": "air", "unit": "kg"})
+
+        assert not hasattr(flow, "__dict__"), "Expected Flow to use __slots__"
+        copied = copy(flow)
+        assert copied == flow, "Expected copied flow to equal the original"
+        assert copied._id == flow._id, "Expected copied flow to keep the same _id"
+
 
 class TestFlowComparison:
     """Test Flow __lt__ method."""
@@ -632,6 +677,19 @@ class TestFlowComparison:
 
         assert flow1 < flow2, "Expected id1 < id2 when other fields are equal"
 
+    def test_lt_with_missing_identifier(self):
+        """Test sorting identical flows where only one has an identifier."""
+        flow1 = Flow.from_dict({"name": "Ammonia", "context": "air", "unit": "kg"})
+        flow2 = Flow.from_dict(
+            {"name": "Ammonia", "context": "air", "unit": "kg", "identifier": "id1"}
+        )
+
+        assert flow1 < flow2, "Expected missing identifier to sort first"
+        assert sorted([flow2, flow1], key=lambda flow: flow.sort_key) == [
+            flow1,
+            flow2,
+        ], "Expected sort_key to give the same order as __lt__"
+
     def test_lt_with_non_flow_object(self):
         """Test comparison with non-Flow objects."""
         flow = Flow.from_dict(
@@ -731,3 +789,147 @@ class TestFlowConversionFactor:
         assert (
             "conversion_factor=" not in result
         ), "Expected conversion_factor not in repr when None"
+
+
+class TestFlowFromDicts:
+    """Test Flow from_dicts bulk constructor."""
+
+    def test_from_dicts_matches_from_dict(self):
+        """Test bulk construction gives the same data as from_dict."""
+        data = [
+            {"name": "Carbon dioxide", "context": ["air", "urban"], "unit": "kg"},
+            {
+                "name": "Methane",
+                "context": ["air", "urban"],
+                "unit": "kg",
+                "cas_number": "74-82-8",
+                "location": "NL",
+            },
+        ]
+        flows = Flow.from_dicts(data)
+
+        assert [flow.to_dict() for flow in flows] == [
+            Flow.from_dict(obj).to_dict() for obj in data
+        ], "Expected from_dicts to match from_dict"
+
+    def test_from_dicts_cas_numbers_match_from_dict(self):
+        """Test bulk CAS validation gives the same CAS numbers as from_dict."""
+        data = [
+            {"name": "Water", "context": "air", "unit": "kg", "cas_number": cas}
+            for cas in ["7732-18-5", "7732-18-6", "", None, " 0007732-18-5"]
+        ]
+        flows = Flow.from_dicts(data)
+
+        assert [flow.cas_number for flow in flows] == [
+            Flow.from_dict(obj).cas_number for obj in data
+        ], "Expected from_dicts CAS numbers to match from_dict"
+        assert flows[2].cas_number is None, "Expected no CAS number for ''"
+
+    def test_from_dicts_shares_unit_and_context(self):
+        """Test repeated unit and context values share field instances."""
+        flows = Flow.from_dicts(
+            [
+                {"name": "Carbon dioxide", "context": ["air"], "unit": "kg"},
+                {"name": "Methane", "context": ["air"], "unit": "kg"},
+            ]
+        )
+
+        assert flows[0].unit is flows[1].unit, "Expected shared UnitField"
+        assert flows[0].context is flows[1].context, "Expected shared ContextField"
+        assert flows[0] != flows[1], "Expected distinct flows"
+
+    def test_from_dicts_list_and_tuple_contexts_are_equal(self):
+        """Test list and tuple contexts give one equal, tuple-backed field."""
+        flows = Flow.from_dicts(
+            [
+                {"name": "Carbon dioxide", "context": ["air", "urban"], "unit": "kg"},
+                {"name": "Methane", "context": ("air", "urban"), "unit": "kg"},
+            ]
+        )
+
+        assert (
+            flows[0].context == flows[1].context
+        ), "Expected list and tuple contexts to compare equal"
+        assert flows[1].context.value == (
+            "air",
+            "urban",
+        ), "Expected the shared context to be stored as a tuple"
+        assert flows[1].context == ContextField(
+            ("air", "urban")
+        ), "Expected the context to equal a tuple-backed ContextField"
+
+
+class TestFlowNormalizeMany:
+    """Test Flow normalize_many method."""
+
+    def test_normalize_many_matches_normalize(self):
+        """Test normalize_many gives the same data as normalize."""
+        flows = Flow.from_dicts(
+            [
+                {"name": "Iron(II), NL", "context": "air", "unit": "kg"},
+                {"name": "Iron(II), NL", "context": "water", "unit": "kg"},
+                {
+                    "name": "Ammonia",
+                    "context": "air",
+                    "unit": "kg",
+                    "location": "DE",
+                },
+                {"name": "Ammonia, FR", "context": "air", "unit": "kg"},
+            ]
+        )
+        expected = [flow.normalize().to_dict() for flow in flows]
+        result = [flow.to_dict() for flow in Flow.normalize_many(flows)]
+
+        assert result == expected, f"Expected {expected}, but got {result}"
+
+    def test_normalize_many_shares_name(self):
+        """Test flows with the same name and unit share the normalized name."""
+        flows = Flow.from_dicts(
+            [
+                {"name": "Ammonia, NL", "context": "air", "unit": "kg"},
+                {"name": "Ammonia, NL", "context": "water", "unit": "kg"},
+            ]
+        )
+        first, second = Flow.normalize_many(flows)
+
+        assert first.name is second.name, "Expected shared normalized name"
+        assert first != second, "Expected distinct normalized flows"
+
+    @patch("flowmapper.utils.flow_names.logger")
+    def test_normalize_many_warns_per_flow(self, mock_logger):
+        """Test the incompatible unit slash warning is logged for every flow."""
+        flows = Flow.from_dicts(
+            [
+                {"name": "Water/m3", "context": "air", "unit": "kg"},
+                {"name": "Water/m3", "context": "soil", "unit": "kg"},
+            ]
+        )
+        Flow.normalize_many(flows)
+
+        assert (
+            mock_logger.warning.call_count == 2
+        ), f"Expected one warning per flow, got {mock_logger.warning.call_count}"
+
+
+class TestFlowReplace:
+    """Test Flow replace method."""
+
+    def test_replace_converts_raw_values(self):
+        """Test replace wraps raw values like from_dict."""
+        flow = Flow.from_dict({"name": "Ammonia", "context": "air", "unit": "kg"})
+        replaced = flow.replace(name="Methane", unit="g", cas_number="74-82-8")
+
+        assert replaced.name.data == "Methane", "Expected name to be replaced"
+        assert replaced.unit.data == "g", "Expected unit to be replaced"
+        assert replaced.cas_number == "74-82-8", "Expected CAS number to be parsed"
+        assert flow.name.data == "Ammonia", "Expected original flow to be unchanged"
+
+    def test_replace_keeps_other_fields_and_new_id(self):
+        """Test replace reuses unchanged fields but gives a new _id."""
+        flow = Flow.from_dict({"name": "Ammonia", "context": "air", "unit": "kg"})
+        replaced = flow.replace(location="NL")
+
+        assert replaced.context is flow.context, "Expected context to be reused"
+        assert replaced.location == "NL", "Expected location to be replaced"
+        assert replaced._id != flow._id, "Expected a new _id"
+        assert replaced != flow, "Expected replaced flow to be a distinct flow"
@@ -229,6 +229,37 @@ class TestMatchComparison:
         assert match1 < match2, "Expected match1 to be less than match2"
         assert not (match2 < match1), "Expected match2 not to be less than match1"
 
+    def test_match_sort_key_is_cached(self):
+        """Test Match sort_key is computed once and orders like __lt__."""
+        matches = [
+            Match(
+                source=Flow.from_dict({"name": name, "context": "air", "unit": "kg"}),
+                target=Flow.from_dict({"name": "X", "context": "air", "unit": "kg"}),
+                function_name="test",
+                condition=MatchCondition.exact,
+            )
+            for name in ("C", "A", "B")
+        ]
+
+        assert (
+            matches[0].sort_key is matches[0].sort_key
+        ), "Expected sort_key to be cached"
+        assert sorted(matches, key=lambda m: m.sort_key) == sorted(
+            matches
+        ), "Expected sort_key to give the same order as __lt__"
+
+    def test_match_has_no_dict(self):
+        """Test Match uses __slots__."""
+        flow = Flow.from_dict({"name": "A", "context": "air", "unit": "kg"})
+        match = Match(
+            source=flow,
+            target=flow,
+            function_name="test",
+            condition=MatchCondition.exact,
+        )
+        match.sort_key
+        assert not hasattr(match, "__dict__"), "Expected Match to use __slots__"
+
     def test_match_comparison_with_same_source_different_target(self):
         """Test Match comparison with same source but different target."""
         source = Flow.from_dict({"name": "A", "context": "air", "unit": "kg"})
@@ -427,6 +458,34 @@ class TestMatchExportEdgeCases:
             exported["target"]["name"], str
         ), "Expected name to be string, not UserString"
 
+    def test_export_serializes_cas_numbers_as_plain_strings(self):
+        """Test export converts CASField, a str subclass, to a plain str."""
+        source_flow = Flow.from_dict(
+            {
+                "name": "Carbon dioxide",
+                "context": "air",
+                "unit": "kg",
+                "cas_number": "124-38-9",
+            }
+        )
+        target_flow = Flow.from_dict({"name": "CO2", "context": "air", "unit": "kg"})
+
+        match = Match(
+            source=source_flow,
+            target=target_flow,
+            function_name="test_function",
+            condition=MatchCondition.exact,
+        )
+
+        exported = match.export()
+
+        assert (
+            exported["source"]["cas_number"] == "124-38-9"
+        ), "Expected the CAS number to be exported"
+        assert (
+            type(exported["source"]["cas_number"]) is str
+        ), "Expected the CAS number to be a plain str, not a CASField"
+
     def test_export_serializes_contextfield_objects(self):
         """Test export serializes ContextField objects."""
         source_flow = Flow.from_dict(
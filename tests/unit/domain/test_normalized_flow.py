@@ -65,8 +65,8 @@ class TestNormalizedFlowResetCurrent:
             nf.current._id != old_current_id
         ), "Expected reset_current to create a new Flow instance with different _id"
         assert (
-            nf.current is not normalized
-        ), "Expected reset_current to create a copy, not reference to normalized"
+            nf.current is normalized
+        ), "Expected reset_current to share the frozen normalized flow"
 
     def test_reset_current_preserves_normalized(self):
         """Test reset_current does not modify normalized flow."""
@@ -653,8 +653,8 @@ class TestNormalizedFlowFromDict:
             nf.normalized.name.data == "carbon dioxide"
         ), "Expected normalized name without location"
 
-    def test_from_dict_sets_current_as_copy_of_normalized(self):
-        """Test from_dict sets current as copy of normalized."""
+    def test_from_dict_sets_current_to_normalized(self):
+        """Test from_dict sets current to the normalized flow."""
         data = {
             "name": "Carbon dioxide",
             "context": "air",
@@ -666,8 +666,27 @@ class TestNormalizedFlowFromDict:
             nf.current.name.data == nf.normalized.name.data
         ), "Expected current equals normalized"
         assert (
-            nf.current is not nf.normalized
-        ), "Expected current is a copy, not same object"
+            nf.current is nf.normalized
+        ), "Expected current to share the frozen normalized flow"
+
+    def test_from_dict_instance_has_no_dict(self):
+        """Test NormalizedFlow uses __slots__."""
+        nf = NormalizedFlow.from_dict(
+            {"name": "Carbon dioxide", "context": "air", "unit": "kg"}
+        )
+        assert not hasattr(nf, "__dict__"), "Expected NormalizedFlow to use __slots__"
+
+    def test_equality_compares_flows_and_matched(self):
+        """Test NormalizedFlow equality uses its flows and matched flag."""
+        nf = NormalizedFlow.from_dict(
+            {"name": "Carbon dioxide", "context": "air", "unit": "kg"}
+        )
+        same = NormalizedFlow(
+            original=nf.original, normalized=nf.normalized, current=nf.current
+        )
+        assert nf == same, "Expected NormalizedFlow with same flows to be equal"
+        same.matched = True
+        assert nf != same, "Expected differing matched flag to break equality"
 
 
 class TestNormalizedFlowUnitCompatible:
@@ -985,3 +1004,40 @@ class TestNormalizedFlowProperties:
 
         nf.reset_current()
         assert nf.name == normalized_name, "Expected name to reset after reset_current"
+
+    def test_properties_reflect_assigned_current(self):
+        """Test properties follow a Flow assigned directly to current."""
+        nf = NormalizedFlow.from_dict(
+            {"name": "Carbon dioxide", "context": "air", "unit": "kg"}
+        )
+        nf.current = Flow.from_dict(
+            {
+                "name": "Methane",
+                "context": ["water", "river"],
+                "unit": "g",
+                "cas_number": "74-82-8",
+            }
+        )
+
+        assert nf.name == "Methane", f"Expected name 'Methane', got {nf.name!r}"
+        assert nf.unit == "g", f"Expected unit 'g', got {nf.unit!r}"
+        assert nf.context == (
+            "water",
+            "river",
+        ), f"Expected context ('water', 'river'), got {nf.context!r}"
+        assert (
+            nf.cas_number == "74-82-8"
+        ), f"Expected cas_number '74-82-8', got {nf.cas_number!r}"
+
+    def test_assigning_matched_keeps_derived_values(self):
+        """Test assigning other attributes does not touch the derived values."""
+        nf = NormalizedFlow.from_dict(
+            {"name": "Carbon dioxide", "context": "air", "unit": "kg"}
+        )
+        nf.name = "Changed"
+        nf.matched = True
+
+        assert nf.matched is True, "Expected matched to be a plain attribute"
+        assert (
+            nf.name == "Changed"
+        ), f"Expected name to stay 'Changed' after assigning matched, got {nf.name!r}"
@@ -55,6 +55,13 @@ class TestContextFieldInitialization:
         c = ContextField(tuple([]))
         assert c.value == (), f"Expected c.value to be (), but got {c.value!r}"
 
+    def test_instances_have_no_dict(self):
+        """Test that ContextField uses __slots__ instead of a per-instance dict."""
+        c = ContextField("Raw/(unspecified)")
+        assert not hasattr(
+            c, "__dict__"
+        ), "Expected ContextField instances to have no __dict__"
+
 
 class TestContextFieldNormalize:
     """Test ContextField normalize method."""
@@ -201,6 +208,43 @@ class TestContextFieldNormalize:
             c.value == "A/B"
         ), f"Expected original c.value to remain 'A/B', but got {c.value!r}"
 
+    def test_normalize_list_and_tuple_give_same_result(self):
+        """Test normalize gives equal results for list, tuple, and repeated input."""
+        from_list = ContextField(["Air", "Urban air close to ground"]).normalize()
+        from_tuple = ContextField(("Air", "Urban air close to ground")).normalize()
+        again = ContextField(["Air", "Urban air close to ground"]).normalize()
+        assert (
+            from_list.value == from_tuple.value == again.value
+        ), f"Expected equal normalized values, but got {from_list.value!r}, {from_tuple.value!r}, {again.value!r}"
+
+    def test_normalize_with_unhashable_invalid_type_raises_error(self):
+        """Test normalize with unhashable invalid type raises ValueError."""
+        c = ContextField("A/B")
+        with pytest.raises(ValueError, match="Can't understand input context"):
+            c.normalize({"a": "b"})
+
+    def test_normalize_returns_shared_instance(self):
+        """Test normalize returns one shared instance per normalized context."""
+        first = ContextField("Air/Urban air").normalize()
+        second = ContextField(["air", "urban air "]).normalize()
+        assert (
+            first is second
+        ), "Expected normalize() to return the same instance for equal normalized contexts"
+        assert (
+            ContextField.get(("air", "urban air")) is first
+        ), "Expected get() to return the shared instance"
+
+    def test_normalize_of_normalized_returns_self(self):
+        """Test normalizing an already normalized context returns it unchanged."""
+        normalized = ContextField("Air/Urban air/unspecified").normalize()
+        assert (
+            normalized.normalize() is normalized
+        ), "Expected normalize() on a normalized context to return itself"
+        assert normalized.value == (
+            "air",
+            "urban air",
+        ), f"Expected value ('air', 'urban air'), got {normalized.value!r}"
+
     def test_normalize_with_invalid_type_raises_error(self):
         """Test normalize with invalid type raises ValueError."""
 
@@ -255,6 +299,16 @@ class TestContextFieldExportAsString:
             result == "A|B|C"
         ), f"Expected export_as_string('|') to be 'A|B|C', but got {result!r}"
 
+    def test_export_as_string_alternating_join_characters(self):
+        """Test export_as_string with different join characters on one instance."""
+        c = ContextField(("A", "B"))
+        assert c.export_as_string("/") == "A/B", "Expected '/' to be used"
+        assert c.export_as_string("/") is c.export_as_string(
+            "/"
+        ), "Expected repeated exports to reuse the joined string"
+        assert c.export_as_string() == "A✂️B", "Expected default join character"
+        assert c.export_as_string("/") == "A/B", "Expected '/' to be used again"
+
     def test_export_as_string_with_custom_join_character_dash(self):
         """Test export_as_string with custom join_character '-'."""
         c = ContextField(["A", "B"])
@@ -336,6 +390,20 @@ class TestContextFieldEq:
             c1 != c2
         ), f"Expected c1 to not equal c2 for empty strings, but they are equal (c1={c1!r}, c2={c2!r})"
 
+    def test_eq_with_empty_other_contextfield(self):
+        """Test a non-empty context doesn't equal an empty ContextField."""
+        c1 = ContextField(("air",))
+        c2 = ContextField("")
+        assert c1 != c2, f"Expected c1 to not equal c2, but they are equal (c1={c1!r})"
+        assert c1 == c1, "Expected a context to equal itself"
+
+    def test_eq_empty_contextfield_with_itself(self):
+        """Test an empty context equals itself."""
+        for value in ("", (), []):
+            c = ContextField(value)
+            assert c == c, f"Expected empty context {value!r} to equal itself"
+            assert not (c != c), f"Expected empty context {value!r} not to differ"
+
     def test_eq_with_other_type(self):
         """Test equality with non-ContextField type."""
         c = ContextField("A/B")
@@ -404,6 +472,13 @@ class TestContextFieldHash:
             result, int
         ), f"Expected hash(c) to be an int, but got {type(result)}"
 
+    def test_hash_is_stable(self):
+        """Test __hash__ returns the same value on repeated calls."""
+        c = ContextField(("A", "B"))
+        assert (
+            hash(c) == hash(c) == hash(("A", "B"))
+        ), "Expected cached hash to equal the hash of the value"
+
     def test_hash_same_values(self):
         """Test __hash__ with same values."""
         c1 = ContextField("A/B")
@@ -77,10 +77,10 @@ class TestFlowmapGenerateMatches:
     """Test Flowmap generate_matches method."""
 
     @patch("flowmapper.flowmap.logger")
-    @patch("flowmapper.flowmap.time")
+    @patch("flowmapper.flowmap.perf_counter")
     def test_generate_matches_applies_rules(self, mock_time, mock_logger):
         """Test that generate_matches applies all rules."""
-        # time() is called once per rule for start time, then again for elapsed
+        # perf_counter() is called once per rule for start time, then again for elapsed
         # Provide enough values: start1, end1, start2, end2
         mock_time.side_effect = [0.0, 1.0, 1.0, 2.0]
 
@@ -122,7 +122,7 @@ class TestFlowmapGenerateMatches:
         assert flowmap.matches == [match1, match2]
 
     @patch("flowmapper.flowmap.logger")
-    @patch("flowmapper.flowmap.time")
+    @patch("flowmapper.flowmap.perf_counter")
     def test_generate_matches_filters_matched_flows(self, mock_time, mock_logger):
         """Test that generate_matches only passes unmatched flows to rules."""
         mock_time.side_effect = [0.0, 1.0]
@@ -153,7 +153,7 @@ class TestFlowmapGenerateMatches:
         assert call_args.kwargs["source_flows"][0] == source_flow1
 
     @patch("flowmapper.flowmap.logger")
-    @patch("flowmapper.flowmap.time")
+    @patch("flowmapper.flowmap.perf_counter")
     def test_generate_matches_adds_new_target_flows(self, mock_time, mock_logger):
         """Test that generate_matches adds new target flows when created."""
         mock_time.side_effect = [0.0, 1.0]
@@ -187,7 +187,7 @@ class TestFlowmapGenerateMatches:
         flowmap.add_new_target_flows.assert_called_once_with([new_target_flow])
 
     @patch("flowmapper.flowmap.logger")
-    @patch("flowmapper.flowmap.time")
+    @patch("flowmapper.flowmap.perf_counter")
     def test_generate_matches_logs_with_new_target_flows(self, mock_time, mock_logger):
         """Test that generate_matches logs correctly when new target flows are created."""
         mock_time.side_effect = [0.0, 1.0]
@@ -222,7 +222,7 @@ class TestFlowmapGenerateMatches:
         assert "1" in call_args  # 1 new target flow
 
     @patch("flowmapper.flowmap.logger")
-    @patch("flowmapper.flowmap.time")
+    @patch("flowmapper.flowmap.perf_counter")
     def test_generate_matches_logs_without_new_target_flows(
         self, mock_time, mock_logger
     ):
@@ -254,6 +254,79 @@ class TestFlowmapGenerateMatches:
         call_args = mock_logger.info.call_args[0][0]
         assert "new target flows" not in call_args.lower()
 
+    @patch("flowmapper.flowmap.logger")
+    @patch("flowmapper.flowmap.perf_counter")
+    def test_generate_matches_drops_flows_matched_by_earlier_rule(
+        self, mock_time, mock_logger
+    ):
+        """Test that flows matched by one rule are not passed to the next."""
+        mock_time.side_effect = [0.0, 1.0, 1.0, 2.0]
+
+        source_flow1 = Mock(spec=NormalizedFlow)
+        source_flow1.matched = False
+        source_flow2 = Mock(spec=NormalizedFlow)
+        source_flow2.matched = False
+
+        match = Mock(spec=Match)
+        match.new_target_flow = False
+
+        def rule1(source_flows, target_flows):
+            source_flow1.matched = True
+            return [match]
+
+        rule2 = Mock()
+        rule2.__name__ = "rule2"
+        rule2.return_value = []
+
+        flowmap = Flowmap(
+            source_flows=[source_flow1, source_flow2],
+            target_flows=[],
+            data_preparation_functions=[],
+            rules=[rule1, rule2],
+        )
+
+        flowmap.generate_matches()
+
+        assert rule2.call_args.kwargs["source_flows"] == [
+            source_flow2
+        ], "Expected only the still unmatched flow to be passed to the second rule"
+
+    @patch("flowmapper.flowmap.logger")
+    @patch("flowmapper.flowmap.perf_counter")
+    def test_generate_matches_resets_cached_unmatched_source(
+        self, mock_time, mock_logger
+    ):
+        """Test that unmatched_source is recomputed after generating matches."""
+        mock_time.side_effect = [0.0, 1.0]
+
+        source_flow = Mock(spec=NormalizedFlow)
+        source_flow.matched = False
+        source_flow.id = 1
+
+        match = Mock(spec=Match)
+        match.new_target_flow = False
+        match.source = Mock(_id=1)
+
+        rule = Mock()
+        rule.__name__ = "test_rule"
+        rule.return_value = [match]
+
+        flowmap = Flowmap(
+            source_flows=[source_flow],
+            target_flows=[],
+            data_preparation_functions=[],
+            rules=[rule],
+        )
+        assert flowmap.unmatched_source == [
+            source_flow
+        ], "Expected all source flows to be unmatched before matching"
+
+        flowmap.generate_matches()
+
+        assert (
+            flowmap.unmatched_source == []
+        ), "Expected unmatched_source to reflect the new matches"
+
 
 class TestFlowmapAddNewTargetFlows:
     """Test Flowmap add_new_target_flows method."""
@@ -287,6 +360,33 @@ class TestFlowmapAddNewTargetFlows:
         assert len(flowmap.target_flows) == 2
         assert flowmap.target_flows == [normalized_flow1, normalized_flow2]
 
+    @patch(
+        "flowmapper.flowmap.apply_transformation_and_convert_flows_to_normalized_flows"
+    )
+    def test_add_new_target_flows_resets_target_statistics(self, mock_apply):
+        """Test that add_new_target_flows resets cached target statistics."""
+        air_context = Mock()
+        air_context.value = "air"
+        target_flow = Mock(spec=NormalizedFlow)
+        target_flow.original = Mock()
+        target_flow.original.context = air_context
+        mock_apply.return_value = [target_flow]
+
+        flowmap = Flowmap(
+            source_flows=[],
+            target_flows=[],
+            data_preparation_functions=[],
+        )
+        assert (
+            flowmap.matched_target_statistics.empty
+        ), "Expected no statistics without target flows"
+
+        flowmap.add_new_target_flows([Mock(spec=Flow)])
+
+        assert flowmap.matched_target_statistics["total"].tolist() == [
+            1
+        ], "Expected statistics to include the new target flow"
+
 
 class TestFlowmapMatchedSource:
     """Test Flowmap matched_source method."""
@@ -342,6 +442,34 @@ class TestFlowmapMatchedSource:
 
         assert result == []
 
+    def test_matched_source_complements_unmatched_source(self):
+        """Test that matched and unmatched source flows split the source flows."""
+        source_flow1 = Mock(spec=NormalizedFlow)
+        source_flow1.id = 1
+        source_flow2 = Mock(spec=NormalizedFlow)
+        source_flow2.id = 2
+
+        match = Mock(spec=Match)
+        match.source = Mock(spec=Flow)
+        match.source._id = 2
+
+        flowmap = Flowmap(
+            source_flows=[source_flow1, source_flow2],
+            target_flows=[],
+            data_preparation_functions=[],
+        )
+        flowmap.matches = [match]
+
+        matched = flowmap.matched_source()
+        matched.clear()
+
+        assert flowmap.matched_source() == [
+            source_flow2
+        ], "Expected matched_source to return a new list on every call"
+        assert flowmap.unmatched_source == [
+            source_flow1
+        ], "Expected unmatched_source to hold the remaining flows"
+
 
 class TestFlowmapUnmatchedSource:
     """Test Flowmap unmatched_source property."""
@@ -528,6 +656,38 @@ class TestFlowmapMatchedSourceStatistics:
         # Should be sorted by percent ascending
         assert result.iloc[0]["percent"] <= result.iloc[1]["percent"]
 
+    def test_matched_source_statistics_context_only_in_matches(self):
+        """Test that contexts without source flows get a zero total."""
+        air_context = Mock()
+        air_context.value = "air"
+        soil_context = Mock()
+        soil_context.value = "soil"
+
+        source_flow = Mock(spec=NormalizedFlow)
+        source_flow.original = Mock()
+        source_flow.original.context = air_context
+
+        match1 = Mock(spec=Match)
+        match1.source = Mock()
+        match1.source.context = soil_context
+
+        flowmap = Flowmap(
+            source_flows=[source_flow],
+            target_flows=[],
+            data_preparation_functions=[],
+        )
+        flowmap.matches = [match1]
+
+        result = flowmap.matched_source_statistics()
+
+        soil_row = result[result["context"] == "soil"].iloc[0]
+        assert soil_row["matched"] == 1, "Expected one soil match"
+        assert soil_row["total"] == 0, "Expected no soil source flows"
+        air_row = result[result["context"] == "air"].iloc[0]
+        assert air_row["matched"] == 0, "Expected no air matches"
+        assert air_row["total"] == 1, "Expected one air source flow"
+        assert result["matched"].dtype.kind == "i", "Expected integer counts"
+
 
 class TestFlowmapMatchedTargetStatistics:
     """Test Flowmap matched_target_statistics property."""
@@ -807,6 +967,42 @@ class TestFlowmapCardinalities:
         from_ids = [r["from"] for r in result]
         assert from_ids == sorted(from_ids)
 
+    def test_cardinalities_without_matches(self):
+        """Test cardinalities returns an empty list without matches."""
+        flowmap = Flowmap(
+            source_flows=[],
+            target_flows=[],
+            data_preparation_functions=[],
+        )
+
+        assert flowmap.cardinalities() == [], "Expected no cardinalities"
+
+    def test_cardinalities_returns_python_ints(self):
+        """Test cardinalities returns plain ints rather than numpy scalars."""
+        source_flow = Mock(spec=Flow)
+        source_flow._id = 5
+        target_flow = Mock(spec=Flow)
+        target_flow._id = 7
+
+        match = Mock(spec=Match)
+        match.source = source_flow
+        match.target = target_flow
+
+        flowmap = Flowmap(
+            source_flows=[],
+            target_flows=[],
+            data_preparation_functions=[],
+        )
+        flowmap.matches = [match]
+
+        result = flowmap.cardinalities()
+
+        assert result == [
+            {"from": 5, "to": 7, "cardinality": "1:1"}
+        ], "Expected a single 1:1 mapping"
+        assert type(result[0]["from"]) is int, "Expected a plain int source ID"
+        assert type(result[0]["cardinality"]) is str, "Expected a plain str label"
+
 
 class TestFlowmapToRandonneur:
     """Test Flowmap to_randonneur method."""
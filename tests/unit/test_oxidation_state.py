@@ -307,6 +307,23 @@ class TestOxidationStateFromString:
             remaining == "foo"
         ), f"Expected remaining to be 'foo', but got {remaining!r}"
 
+    def test_from_string_with_precomputed_match(self):
+        """Test from_string reuses a match from OxidationState.match."""
+        match = OxidationState.match("iron (ii)")
+        os, remaining = OxidationState.from_string("iron (ii)", match=match)
+        assert os.value == 2, f"Expected os.value to be 2, but got {os.value}"
+        assert (
+            remaining == "iron"
+        ), f"Expected remaining to be 'iron', but got {remaining!r}"
+
+    def test_from_string_with_zero(self):
+        """Test from_string with a zero oxidation state written with leading zeros."""
+        os, remaining = OxidationState.from_string("foo, +00")
+        assert os.value == 0, f"Expected os.value to be 0, but got {os.value}"
+        assert (
+            remaining == "foo"
+        ), f"Expected remaining to be 'foo', but got {remaining!r}"
+
     def test_from_string_with_whitespace(self):
         """Test from_string with whitespace around oxidation state."""
         os, remaining = OxidationState.from_string("iron ( II )")
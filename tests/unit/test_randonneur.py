@@ -224,8 +224,8 @@ class TestApplyGenericTransformationsToFlows:
         assert flow.name.data == original_name, "Expected original flow to be unchanged"
         assert result[0].original == flow, "Expected original reference to be preserved"
 
-    def test_current_is_copy_of_normalized(self):
-        """Test that current is a copy of normalized, not a reference."""
+    def test_current_shares_normalized(self):
+        """Test that current starts as the (immutable) normalized flow itself."""
         flow = Flow.from_dict(
             {"name": "Carbon dioxide", "context": "air", "unit": "kg"}
         )
@@ -238,8 +238,8 @@ class TestApplyGenericTransformationsToFlows:
         )
 
         assert (
-            result[0].current is not result[0].normalized
-        ), "Expected current to be a copy, not a reference"
+            result[0].current is result[0].normalized
+        ), "Expected current to share the frozen normalized flow"
         assert (
             result[0].current.name.data == result[0].normalized.name.data
         ), "Expected current to have same data as normalized"
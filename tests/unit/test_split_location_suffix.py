@@ -131,6 +131,14 @@ class TestSplitLocationSuffix:
         assert name == "Ammonia", f"Expected name to be 'Ammonia', but got {name!r}"
         assert location == "NL", f"Expected location to be 'NL', but got {location!r}"
 
+    def test_location_code_containing_comma(self):
+        """Test split_location_suffix with a location code that contains a comma."""
+        name, location = split_location_suffix("Aluminium, IAI Area, North America")
+        assert name == "Aluminium", f"Expected name to be 'Aluminium', but got {name!r}"
+        assert (
+            location == "IAI Area, North America"
+        ), f"Expected location to be 'IAI Area, North America', but got {location!r}"
+
 
 class TestReplaceLocationSuffix:
     """Test replace_location_suffix function."""
@@ -244,3 +252,35 @@ class TestReplaceLocationSuffix:
         """Test replace_location_suffix replacing with a shorter location code."""
         result = replace_location_suffix("Ammonia, RER w/o DE+NL+NO", "NL")
         assert result == "Ammonia, NL", f"Expected 'Ammonia, NL', but got {result!r}"
+
+    def test_replace_location_code_containing_comma(self):
+        """Test replace_location_suffix with a location code that contains a comma."""
+        result = replace_location_suffix("Aluminium, IAI Area, North America ", "DE")
+        assert (
+            result == "Aluminium, DE "
+        ), f"Expected result to be 'Aluminium, DE ', but got {result!r}"
+
+
+class TestEndsWithLocation:
+    """Test the lazily compiled ends_with_location regex."""
+
+    def test_regex_agrees_with_split_location_suffix(self):
+        """Test ends_with_location finds the same suffixes as split_location_suffix."""
+        from flowmapper.fields.location import ends_with_location
+
+        for string in (
+            "Ammonia, NL",
+            "Ammonia, pure, NL",
+            "Aluminium, IAI Area, North America",
+            "Ammonia, NL, pure",
+            "Ammonia",
+        ):
+            match = ends_with_location.search(string)
+            expected = (
+                (string[: match.start()], match.group("location"))
+                if match
+                else (string, None)
+            )
+            assert (
+                split_location_suffix(string) == expected
+            ), f"Expected {expected!r} for {string!r}"
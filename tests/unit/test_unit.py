@@ -122,6 +122,13 @@ class TestUnitFieldNormalize:
             normalized, UnitField
         ), f"Expected normalized to be a UnitField instance, but got {type(normalized)}"
 
+    def test_normalize_returns_shared_instance(self):
+        """Test normalize returns one shared instance per input unit."""
+        normalized = UnitField("kg").normalize()
+        assert (
+            UnitField("kg").normalize() is normalized
+        ), "Expected normalize() to return the same instance for the same unit"
+
     def test_normalize_raises_error_undefined_unit(self):
         """Test normalize raises error for undefined unit."""
         u = UnitField("unknown_unit_xyz")